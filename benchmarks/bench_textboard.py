@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import io
+import gc
+import os
+import sys
+import json
+import timeit
+import argparse
+import platform
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+# Benchmark the checkout the script is in, rather than an installed textboard
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from textboard import __version__
+from textboard.ansi import TextStyle, TextColors
+from textboard.board import BoardLine, BoardSector, PlainTextLine, ProcessSector, TextBoard
+from textboard.sink import NullSink
+
+BUILD_FIELDS_COUNTS = (1, 5, 10, 25, 50)
+DRAW_LINES_COUNTS = (10, 100, 1000, 10000)
+DRAW_SECTOR_LINES_COUNT = 100
+INGEST_LINES_COUNT = 100000
+MEMORY_OBJECTS_COUNT = 1000
+
+LOWER_IS_BETTER = "lower"
+HIGHER_IS_BETTER = "higher"
+
+def _best_time(func, repeat, min_time=0.05):
+    """_best_time(func, repeat, min_time=0.05) -> float
+    Returns the best time in seconds of a single call to the given function. The number of calls of
+    each repetition is increased until a repetition takes at least min_time seconds.
+
+    func - The function to time
+    repeat - The number of repetitions to take the best time of
+    min_time - The minimal duration of a repetition in seconds (default: 0.05)
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    return min([elapsed] + timer.repeat(repeat - 1, number)) / number
+
+def _styled_line(fields_count, styled):
+    """_styled_line(fields_count, styled) -> BoardLine
+    Create a line with the given number of fields, every other field is styled if styled is set
+    """
+    style = TextStyle(fg=TextColors.green, bold=True)
+    line = BoardLine()
+    for i in range(fields_count):
+        line.add("f{i}".format(i=i), size=8, text="v{i}".format(i=i), style=style if styled and i % 2 else None)
+    return line
+
+def _filled_board(lines_count, diff_draw):
+    """_filled_board(lines_count, diff_draw) -> TextBoard
+    Create a board drawn to a NullSink, filled with sectors of plain text lines
+    """
+    board = TextBoard(max_lines_count=lines_count, diff_draw=diff_draw, sink=NullSink())
+    for sector_index in range(0, lines_count, DRAW_SECTOR_LINES_COUNT):
+        sector_lines_count = min(DRAW_SECTOR_LINES_COUNT, lines_count - sector_index)
+        sector = BoardSector("s{i}".format(i=sector_index), max_lines_count=sector_lines_count)
+        for i in range(sector_lines_count):
+            sector.add(PlainTextLine.create(text="line {i} of the board".format(i=sector_index + i)))
+        board.add(sector)
+    board.draw()
+    return board
+
+def bench_field_set(repeat):
+    """bench_field_set(repeat)
+    Setting the text of a field of a dynamic line class
+    """
+    line = BoardLine().add("log_id", size=5).add("level", size=8).add("info", size=30) >> "BenchLine"
+    line = line()
+    values = ["INFO", "ERROR"]
+
+    def set_field():
+        line.level = values[0]
+        line.level = values[1]
+
+    yield "field_set", lambda: _best_time(set_field, repeat) / 2, "s", LOWER_IS_BETTER
+
+def bench_instantiate(repeat):
+    """bench_instantiate(repeat)
+    Creating instances of dynamic line and sector classes
+    """
+    LogLine = BoardLine().add("log_id", size=5).add("level", size=8).add("info", size=30) >> "BenchInstLine"
+    sector = BoardSector("s", max_lines_count=10, title_line=PlainTextLine.create(text="title"))
+    for i in range(10):
+        sector.add(LogLine.create("l{i}".format(i=i), info="line {i}".format(i=i)))
+    LogSector = sector >> "BenchInstSector"
+
+    yield "instantiate/3_fields_line", lambda: _best_time(LogLine, repeat), "s", LOWER_IS_BETTER
+    yield "instantiate/sector_10_lines", lambda: _best_time(lambda: LogSector("s"), repeat), "s", LOWER_IS_BETTER
+
+def bench_build(repeat):
+    """bench_build(repeat)
+    Building lines of 1 to 50 fields, with and without styles
+    """
+    def measure(fields_count, styled):
+        line = _styled_line(fields_count, styled)
+        fields = list(line._fields.values())
+
+        def build():
+            for field in fields:
+                field._built = None
+            line._cache = None
+            line._build()
+
+        return _best_time(build, repeat)
+
+    for styled in (False, True):
+        for fields_count in BUILD_FIELDS_COUNTS:
+            name = "build/{count}_fields/{kind}".format(count=fields_count, kind="styled" if styled else "plain")
+            yield name, lambda fields_count=fields_count, styled=styled: measure(fields_count, styled), \
+                "s", LOWER_IS_BETTER
+
+def bench_draw(repeat):
+    """bench_draw(repeat)
+    Drawing boards of 10 to 10k lines, fully and differentially after a single line was changed
+    """
+    def measure_full(lines_count):
+        board = _filled_board(lines_count, diff_draw=False)
+        lines = [line for sector in board._board.values() for line in sector.lines.values()]
+
+        def full_draw():
+            # Every row is rebuilt, not only joined from the cached rows
+            for line in lines:
+                line.invalidate()
+            board.draw()
+
+        return _best_time(full_draw, repeat)
+
+    def measure_diff(lines_count):
+        board = _filled_board(lines_count, diff_draw=True)
+        line = next(iter(board.s0.lines.values()))
+        texts = ["changed", "changed again"]
+
+        def diff_draw():
+            line.text = texts[0]
+            board.draw()
+            line.text = texts[1]
+            board.draw()
+
+        return _best_time(diff_draw, repeat) / 2
+
+    for lines_count in DRAW_LINES_COUNTS:
+        yield "draw/{count}_lines/full".format(count=lines_count), \
+            lambda lines_count=lines_count: measure_full(lines_count), "s", LOWER_IS_BETTER
+        yield "draw/{count}_lines/diff_one_line".format(count=lines_count), \
+            lambda lines_count=lines_count: measure_diff(lines_count), "s", LOWER_IS_BETTER
+
+def bench_ingest(repeat):
+    """bench_ingest(repeat)
+    Ingesting the output of a process into a ProcessSector, in lines per second
+    """
+    output = "".join("[{i:08}] some output line of the tracked process\n".format(i=i) for i in range(INGEST_LINES_COUNT))
+
+    def update_from_file():
+        sector = ProcessSector("p", max_lines_count=20)
+        stream = io.StringIO(output)
+        while sector.update_from_file(stream):
+            pass
+
+    def feed():
+        sector = ProcessSector("p", max_lines_count=20)
+        for i in range(0, len(output), 64 * 1024):
+            sector.feed(output[i:i + 64 * 1024])
+        sector.feed_eof()
+
+    yield "ingest/update_from_file", lambda: INGEST_LINES_COUNT / _best_time(update_from_file, repeat), \
+        "lines/s", HIGHER_IS_BETTER
+    yield "ingest/feed", lambda: INGEST_LINES_COUNT / _best_time(feed, repeat), "lines/s", HIGHER_IS_BETTER
+
+def _allocated_size(create):
+    """_allocated_size(create) -> float
+    Returns the average number of bytes allocated by a call to the given function
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [create() for i in range(MEMORY_OBJECTS_COUNT)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del objects
+    return float(after - before) / MEMORY_OBJECTS_COUNT
+
+def bench_memory(repeat):
+    """bench_memory(repeat)
+    The memory allocated per line and per sector (requires tracemalloc)
+    """
+    if tracemalloc is None:
+        return
+    LogLine = BoardLine().add("log_id", size=5).add("level", size=8).add("info", size=30) >> "BenchLogLine"
+
+    def sector():
+        sector = BoardSector("s", max_lines_count=10)
+        for i in range(10):
+            sector.add(PlainTextLine.create(text="line"))
+        return sector
+
+    yield "memory/plain_text_line", lambda: _allocated_size(lambda: PlainTextLine.create(text="line")), \
+        "B", LOWER_IS_BETTER
+    yield "memory/3_fields_line", lambda: _allocated_size(LogLine), "B", LOWER_IS_BETTER
+    yield "memory/sector_10_lines", lambda: _allocated_size(sector), "B", LOWER_IS_BETTER
+    yield "memory/process_sector_10_lines", \
+        lambda: _allocated_size(lambda: ProcessSector("p", max_lines_count=10)), "B", LOWER_IS_BETTER
+
+BENCHMARKS = [bench_field_set, bench_instantiate, bench_build, bench_draw, bench_ingest, bench_memory]
+
+def run(repeat, name_filter=None):
+    """run(repeat, name_filter=None) -> dict
+    Run the benchmarks and return their results by name
+
+    repeat - The number of repetitions to take the best time of
+    name_filter - A substring the names of the benchmarks to run must contain (default: None - run all)
+    """
+    results = {}
+    for benchmark in BENCHMARKS:
+        for name, measure, unit, better in benchmark(repeat):
+            if name_filter and name_filter not in name:
+                continue
+            value = measure()
+            results[name] = {"value": value, "unit": unit, "better": better}
+            print("{name:40} {value}".format(name=name, value=_format_value(value, unit)))
+    return results
+
+def _format_value(value, unit):
+    if unit == "s":
+        for scale, scale_unit in ((1e-6, "us"), (1e-3, "ms")):
+            if value < scale * 1000:
+                return "{value:10.3f} {unit}".format(value=value / scale, unit=scale_unit)
+        return "{value:10.3f} s".format(value=value)
+    return "{value:10.1f} {unit}".format(value=value, unit=unit)
+
+def compare(results, baseline, threshold):
+    """compare(results, baseline, threshold) -> list
+    Print the change of each result from the baseline, and return the names of the results that
+    regressed by more than the given threshold
+
+    results - The results of the current run
+    baseline - The results of a previous run
+    threshold - The allowed regression ratio (e.g. 0.1 for 10%)
+    """
+    regressions = []
+    print("\n{name:40} {base:>13} {current:>13} {change:>8}".format(name="benchmark", base="baseline",
+                                                                     current="current", change="change"))
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        base = baseline[name]["value"]
+        value = result["value"]
+        change = (value - base) / base if base else 0.0
+        regressed = change > threshold if result["better"] == LOWER_IS_BETTER else change < -threshold
+        if regressed:
+            regressions.append(name)
+        print("{name:40} {base} {value} {change:+7.1%}{mark}".format(
+            name=name, base=_format_value(base, result["unit"]), value=_format_value(value, result["unit"]),
+            change=change, mark=" !" if regressed else ""))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks of the textboard rendering and ingestion hot paths.")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of repetitions to take the best time of")
+    parser.add_argument("--filter", default=None, help="run only the benchmarks whose names contain this string")
+    parser.add_argument("--json", default=None, help="write the results to this JSON file")
+    parser.add_argument("--compare", default=None, help="compare the results to a JSON file of a previous run")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="the regression ratio that fails the comparison (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat, args.filter)
+    report = {
+        "textboard": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as fd:
+            json.dump(report, fd, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, "r") as fd:
+            baseline = json.load(fd)["results"]
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+
+import asyncio
+import unittest
+
+from textboard.aio import AsyncProcessSector
+
+class UpdateFromStreamTest(unittest.TestCase):
+    def _update(self, data):
+        sector = AsyncProcessSector("s", max_lines_count=3)
+
+        async def update():
+            stream = asyncio.StreamReader(limit=1024)
+            stream.feed_data(data)
+            stream.feed_eof()
+            await sector.update_from_stream(stream)
+
+        asyncio.run(update())
+        return [line.text.text for line in sector.lines.values()]
+
+    def test_line_longer_than_the_stream_limit(self):
+        long_line = "x" * 100000
+        self.assertEqual(self._update("a\n{}\nb".format(long_line).encode()), ["a", long_line, "b"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+
+import io
+import unittest
+import contextlib
+
+from textboard.ansi import ANSI, TextColors, TextStyle
+from textboard.board import BoardLine
+
+class StyleTransitionTest(unittest.TestCase):
+    def test_first_styled_field_is_not_longer_than_its_format(self):
+        style = TextStyle(fg=TextColors.red)
+        line = BoardLine().add("a", text="x", style=style)
+        self.assertEqual(line._build(), style.format("x"))
+
+    def test_transition_from_the_default_state_has_no_reset(self):
+        style = TextStyle(fg=TextColors.red, bold=True)
+        self.assertEqual(TextStyle._transition((), style._key), "\033[1;31m")
+
+class EscapeSequenceTest(unittest.TestCase):
+    def test_frame_false_only_returns_the_sequence(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            esc = ANSI.cur_set(2, 3, frame=False) + ANSI.scrn_reset(frame=False)
+        self.assertEqual(esc, "\033[2;3H\033[2J\033[1;1H")
+        self.assertEqual(output.getvalue(), "")
+
+if __name__ == "__main__":
+    unittest.main()
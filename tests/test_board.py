@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+
+import time
+import threading
+import unittest
+
+from textboard.board import BoardLine, BoardObject, BoardSector, ComputedText, PlainTextLine, TextBoard
+from textboard.sink import NullSink, VirtualScreen
+
+class RemoveTest(unittest.TestCase):
+    def setUp(self):
+        self.board = TextBoard(max_lines_count=3, sink=NullSink())
+        self.sectors = [BoardSector(sector_id, max_lines_count=1) for sector_id in ("a", "b", "c")]
+        self.board.add(*self.sectors)
+
+    def test_remove_returns_the_objects_and_frees_their_lines(self):
+        removed = self.board.remove("a", "b")
+        self.assertEqual(removed, self.sectors[:2])
+        self.assertEqual(list(self.board._board), ["c"])
+        self.assertEqual(self.board.lines_count, 1)
+        self.assertTrue(all(sector._parent is None for sector in removed))
+
+        self.board.add(BoardSector("d", max_lines_count=2))
+        self.assertEqual(self.board.lines_count, 3)
+
+    def test_remove_of_a_missing_id_leaves_the_board_unchanged(self):
+        with self.assertRaises(KeyError):
+            self.board.remove("a", "missing")
+        self.assertEqual(list(self.board._board), ["a", "b", "c"])
+        self.assertEqual(self.board.lines_count, 3)
+        self.assertIs(self.sectors[0]._parent, self.board)
+
+class DrawOnlyObject(BoardObject):
+    """A board object that implements only the public interface"""
+    id = "custom"
+    lines_count = max_lines_count = 2
+
+    def draw(self, frame=None):
+        frame.append("first\nsecond\n")
+
+class CustomBoardObjectTest(unittest.TestCase):
+    def test_object_that_only_draws_is_drawn(self):
+        screen = VirtualScreen(20, 5)
+        board = TextBoard(sink=screen)
+        board.add(PlainTextLine.create(text="line"), DrawOnlyObject())
+        board.draw()
+        self.assertEqual(screen.display[:3], ["line", "first", "second"])
+
+    def test_object_that_only_draws_in_a_viewport(self):
+        screen = VirtualScreen(20, 5)
+        board = TextBoard(max_lines_count=2, viewport=True, sink=screen)
+        board.add(PlainTextLine.create(text="line"), DrawOnlyObject())
+        board.scroll_to(1)
+        board.draw()
+        self.assertEqual(screen.display[:2], ["first", "second"])
+
+class FieldUpdateDuringDrawTest(unittest.TestCase):
+    def setUp(self):
+        self.screen = VirtualScreen(20, 4)
+        self.board = TextBoard(sink=self.screen, diff_draw=True)
+        self.line = BoardLine().add("a", size=6, text="old").add("b", text="B")
+        self.sector = BoardSector("s", max_lines_count=1)
+        self.sector.add(self.line)
+        self.board.add(self.sector)
+        self.board.draw()
+
+    def _preempt_build(self, on_build):
+        """Run on_build once, in the middle of the build of the line's 'b' field, as another thread would"""
+        build_text = BoardLine.LineField._build_text
+        line = self.line
+
+        def preempted_build_text(field):
+            if field.id == "b" and on_build:
+                on_build.pop()(line)
+            return build_text(field)
+
+        BoardLine.LineField._build_text = preempted_build_text
+        self.addCleanup(setattr, BoardLine.LineField, "_build_text", build_text)
+
+    def test_field_set_during_build_is_drawn(self):
+        self.line.b = "C"
+        self._preempt_build([lambda line: setattr(line, "a", "new")])
+        self.board.draw()
+
+        self.assertTrue(self.board._dirty)
+        self.board.draw()
+        self.assertEqual(self.screen.display[0], "new   C")
+
+    def test_field_text_set_during_build_is_drawn(self):
+        self.line.b = "C"
+        self._preempt_build([lambda line: setattr(line.get("a"), "text", "new")])
+        self.board.draw()
+        self.board.draw()
+        self.assertEqual(self.screen.display[0], "new   C")
+
+class DrawInsideBatchTest(unittest.TestCase):
+    def _run_with_timeout(self, target, timeout=10):
+        thread = threading.Thread(target=target)
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout)
+        self.assertFalse(thread.is_alive(), "The board deadlocked")
+
+    def test_draw_inside_batch_while_auto_rendering(self):
+        board = TextBoard(sink=NullSink())
+        line = PlainTextLine.create(text="0")
+        board.add(line)
+        board.start_auto_render(fps=1000)
+        self.addCleanup(board.stop_auto_render)
+
+        def update():
+            for i in range(2000):
+                with board.batch():
+                    line.text = str(i)
+                    board.draw()
+
+        self._run_with_timeout(update)
+
+    def test_on_frame_hook_may_draw(self):
+        board = TextBoard(sink=NullSink())
+        line = PlainTextLine.create(text="0")
+        board.add(line)
+        hook_frames = []
+
+        def on_frame(board, frame_stats):
+            hook_frames.append(frame_stats)
+            if len(hook_frames) == 1:
+                line.text = "1"
+                board.draw()
+
+        board.on_frame = on_frame
+        self._run_with_timeout(board.draw)
+        self.assertEqual(len(hook_frames), 2)
+
+    def test_lock_ownership_is_tracked_per_thread(self):
+        board = TextBoard(sink=NullSink())
+        owned_by_other_thread = []
+        with board.batch():
+            with board.batch():
+                self.assertTrue(board._lock.owned)
+            self.assertTrue(board._lock.owned)
+            thread = threading.Thread(target=lambda: owned_by_other_thread.append(board._lock.owned))
+            thread.start()
+            thread.join()
+        self.assertEqual(owned_by_other_thread, [False])
+        self.assertFalse(board._lock.owned)
+
+    def test_stop_auto_render_inside_batch(self):
+        board = TextBoard(sink=NullSink())
+        line = PlainTextLine.create(text="0")
+        board.add(line)
+        board.start_auto_render(fps=1000)
+
+        def stop():
+            with board.batch():
+                line.text = "1"
+                board.stop_auto_render()
+
+        self._run_with_timeout(stop)
+        self.assertFalse(board.auto_rendering)
+
+class ComputedTextTest(unittest.TestCase):
+    def test_auto_render_refreshes_computed_fields(self):
+        calls = []
+
+        def elapsed():
+            calls.append(time.time())
+            return str(len(calls))
+
+        board = TextBoard(sink=NullSink())
+        board.add(BoardLine().add("elapsed", text=ComputedText(elapsed, ttl=0.05)))
+        board.start_auto_render(fps=50)
+        time.sleep(0.5)
+        board.stop_auto_render()
+        self.assertGreater(len(calls), 3)
+
+class DiffDrawTest(unittest.TestCase):
+    def setUp(self):
+        self.boards = []
+        for diff_draw in (False, True):
+            screen = VirtualScreen(30, 8)
+            board = TextBoard(sink=screen, diff_draw=diff_draw)
+            sector = BoardSector("s", max_lines_count=4)
+            for i in range(3):
+                sector.add(PlainTextLine.create("l{}".format(i), text="line {}".format(i)))
+            board.add(PlainTextLine.create(text="title"), sector)
+            board.draw()
+            self.boards.append((board, sector, screen))
+
+    def _update_and_compare(self, update, clear_screen=False):
+        for board, sector, screen in self.boards:
+            update(sector)
+            board.draw(clear_screen)
+        (full_board, _, full_screen), (diff_board, _, diff_screen) = self.boards
+        self.assertEqual(diff_screen.display, full_screen.display)
+        return diff_board.stats.last_frame
+
+    def test_changed_line_is_the_only_row_written(self):
+        frame_stats = self._update_and_compare(lambda sector: setattr(sector.get("l1"), "text", "changed"))
+        self.assertEqual(frame_stats.rows_written, 1)
+        self.assertGreater(frame_stats.rows_drawn, 1)
+
+    def test_shorter_line_erases_the_rest_of_its_row(self):
+        self._update_and_compare(lambda sector: setattr(sector.get("l0"), "text", "a much longer text"))
+        self._update_and_compare(lambda sector: setattr(sector.get("l0"), "text", "short"))
+        self.assertEqual(self.boards[1][2].display[1], "short")
+
+    def test_removed_lines_are_erased(self):
+        self._update_and_compare(lambda sector: sector.remove("l1", "l2"))
+        self.assertEqual(self.boards[1][2].display[:3], ["title", "line 0", ""])
+
+    def test_unchanged_board_writes_no_rows(self):
+        diff_board = self.boards[1][0]
+        diff_board.invalidate()
+        diff_board.draw()
+        self.assertEqual(diff_board.stats.last_frame.rows_written, 0)
+
+    def test_clear_screen_redraws_every_row(self):
+        frame_stats = self._update_and_compare(lambda sector: None, clear_screen=True)
+        # The empty row of the sector is known to be empty on the cleared screen
+        self.assertEqual(frame_stats.rows_written, 4)
+
+class CopyOnWriteFieldsTest(unittest.TestCase):
+    def setUp(self):
+        self.LogLine = BoardLine().add("level", size=6, text="INFO").add("info", text="-") >> "LogLine"
+
+    def test_instances_share_the_class_fields(self):
+        first, second = self.LogLine(), self.LogLine()
+        self.assertIs(first._fields["level"], self.LogLine._fields["level"])
+        self.assertIs(first._fields["level"], second._fields["level"])
+        self.assertEqual(first._build(), "INFO  -")
+
+    def test_write_copies_the_field_to_the_line(self):
+        first, second = self.LogLine(), self.LogLine()
+        first.level = "ERROR"
+        self.assertIsNot(first._fields["level"], self.LogLine._fields["level"])
+        self.assertIs(first._fields["level"]._line, first)
+        # The other field is still shared
+        self.assertIs(first._fields["info"], second._fields["info"])
+
+        self.assertEqual(first._build(), "ERROR -")
+        self.assertEqual(second._build(), "INFO  -")
+        self.assertEqual(self.LogLine()._build(), "INFO  -")
+
+    def test_field_accessed_through_the_line_is_copied(self):
+        first, second = self.LogLine(), self.LogLine()
+        first.get("info").text = "changed"
+        second.level.text = "DEBUG"
+        self.assertEqual(first._build(), "INFO  changed")
+        self.assertEqual(second._build(), "DEBUG -")
+        self.assertEqual(self.LogLine._fields["info"].text, "-")
+        self.assertEqual(self.LogLine._fields["level"].text, "INFO")
+
+    def test_computed_fields_are_copied_right_away(self):
+        ElapsedLine = BoardLine().add("elapsed", text=ComputedText(lambda: "1s")) >> "ElapsedLine"
+        line = ElapsedLine()
+        self.assertIs(line._fields["elapsed"]._line, line)
+        self.assertIsNot(line._fields["elapsed"], ElapsedLine._fields["elapsed"])
+
+    def test_sector_class_lines_share_their_prototype_fields(self):
+        sector = BoardSector("s", max_lines_count=2)
+        sector.add(self.LogLine("a"))
+        LogSector = sector >> "LogSector"
+        first, second = LogSector("first"), LogSector("second")
+        first_line, second_line = first.get("a"), second.get("a")
+        self.assertIsNot(first_line, second_line)
+        self.assertIs(first_line._fields["level"], second_line._fields["level"])
+
+        first_line.level = "WARN"
+        self.assertEqual(first_line._build(), "WARN  -")
+        self.assertEqual(second_line._build(), "INFO  -")
+        self.assertEqual(LogSector("third").get("a")._build(), "INFO  -")
+
+class FieldSizeTest(unittest.TestCase):
+    def test_int_size_pads_the_text(self):
+        line = BoardLine().add("a", size=5, text="ab").add("b", text="|")
+        self.assertEqual(line._build(), "ab   |")
+
+    def test_format_spec_size_is_honored(self):
+        line = BoardLine().add("a", size=">5", text="ab").add("b", size="^6", text="cd").add("c", text="|")
+        self.assertEqual(line._build(), "   ab  cd  |")
+
+    def test_format_spec_size_of_a_computed_text(self):
+        line = BoardLine().add("a", size=">4", text=ComputedText(lambda: 7)).add("b", text="|")
+        self.assertEqual(line._build(), "   7|")
+
+class RenderStatsTest(unittest.TestCase):
+    def test_frames_coalesced_counts_frames(self):
+        board = TextBoard(sink=NullSink())
+        line = PlainTextLine.create(text="0")
+        board.add(line)
+        self.assertEqual(board.stats.frames_coalesced, 0)
+        board.draw()
+        self.assertEqual(board.stats.frames_coalesced, 0)
+
+        for i in range(1000):
+            line.text = str(i)
+        self.assertEqual(board.stats.frames_coalesced, 0)
+        board.draw()
+        self.assertEqual(board.stats.frames_coalesced, 1)
+
+        line.text = "single"
+        board.draw()
+        self.assertEqual(board.stats.frames_coalesced, 1)
+
+class ViewportHeightTest(unittest.TestCase):
+    def test_viewport_height_comes_from_the_sink(self):
+        screen = VirtualScreen(20, 5)
+        board = TextBoard(max_lines_count=30, viewport=True, sink=screen)
+        for i in range(8):
+            board.add(PlainTextLine.create(text="row{}".format(i)))
+        self.assertEqual(board.viewport_height, 5)
+        board.draw()
+        self.assertEqual(screen.display, ["row0", "row1", "row2", "row3", "row4"])
+
+        board.scroll(3)
+        board.draw()
+        self.assertEqual(screen.display, ["row3", "row4", "row5", "row6", "row7"])
+
+    def test_diff_draw_viewport_keeps_the_first_row(self):
+        screen = VirtualScreen(20, 5)
+        board = TextBoard(max_lines_count=30, viewport=True, diff_draw=True, sink=screen)
+        for i in range(8):
+            board.add(PlainTextLine.create(text="row{}".format(i)))
+        board.draw()
+        self.assertEqual(screen.display, ["row0", "row1", "row2", "row3", "row4"])
+
+    def test_sink_without_a_height_gets_max_lines_count(self):
+        board = TextBoard(max_lines_count=30, viewport=True, sink=NullSink())
+        self.assertEqual(board.viewport_height, 30)
+
+if __name__ == "__main__":
+    unittest.main()
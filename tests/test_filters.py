@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+import re
+import unittest
+
+from textboard.filters import LineFilter, StreamSearch
+from textboard.history import LineHistory
+
+class LineFilterPatternsTest(unittest.TestCase):
+    def test_global_inline_flags(self):
+        line_filter = LineFilter("(?i)error", "warn")
+        self.assertTrue(line_filter.match("ERROR"))
+        self.assertFalse(line_filter.match("WARN"))
+        self.assertTrue(line_filter.match("warn"))
+
+    def test_numbered_backreference(self):
+        line_filter = LineFilter(r"(a)\1", r"(b)\1")
+        self.assertTrue(line_filter.match("xaa"))
+        self.assertFalse(line_filter.match("ab"))
+        self.assertTrue(line_filter.match("bb"))
+        self.assertEqual(line_filter.matched_by_pattern, [1, 1])
+
+    def test_compiled_pattern_flags_are_scoped(self):
+        line_filter = LineFilter(re.compile("error", re.I), "WARN")
+        self.assertTrue(line_filter.match("ErRoR"))
+        self.assertFalse(line_filter.match("warn"))
+        self.assertTrue(line_filter.match("WARN"))
+
+    def test_stream_search_without_combined_pattern(self):
+        history = LineHistory()
+        history.extend(["aa b", "b aa"])
+        search = StreamSearch(history, r"(a)\1", "b")
+        self.assertEqual(search.update(), [(0, 0, 2, 0), (0, 3, 4, 1), (1, 0, 1, 1), (1, 2, 4, 0)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+import unittest
+
+from textboard.board import ProcessSector
+from textboard.history import LineHistory
+
+LINES_COUNT = 2000
+
+def _line(i):
+    return "line {i:05} of the history é".format(i=i)
+
+class SpillTest(unittest.TestCase):
+    def setUp(self):
+        self.history = LineHistory(memory_limit=1024)
+        self.addCleanup(self.history.close)
+        self.history.extend(_line(i) + "\n" for i in range(LINES_COUNT))
+
+    def test_oldest_lines_are_spilled(self):
+        self.assertEqual(len(self.history), LINES_COUNT)
+        self.assertGreater(self.history.spilled_lines_count, 0)
+        self.assertLess(self.history.spilled_lines_count, LINES_COUNT)
+        # Only the chunk that is being filled may be kept above the limit
+        self.assertLessEqual(self.history.memory_size, self.history.memory_limit + self.history._chunk_size)
+
+    def test_spilled_and_memory_lines_are_read_back(self):
+        spilled = self.history.spilled_lines_count
+        self.assertEqual(self.history[0], _line(0))
+        self.assertEqual(self.history[spilled - 1], _line(spilled - 1))
+        self.assertEqual(self.history[spilled], _line(spilled))
+        self.assertEqual(self.history[-1], _line(LINES_COUNT - 1))
+
+    def test_range_across_chunks_and_the_spill_boundary(self):
+        start, stop = self.history.spilled_lines_count - 300, LINES_COUNT - 1
+        self.assertEqual(self.history[start:stop], [_line(i) for i in range(start, stop)])
+        self.assertEqual(list(self.history.lines()), [_line(i) for i in range(LINES_COUNT)])
+
+    def test_out_of_range_line(self):
+        with self.assertRaises(IndexError):
+            self.history[LINES_COUNT]
+
+    def test_sector_views_spilled_lines(self):
+        history = LineHistory(memory_limit=1024)
+        self.addCleanup(history.close)
+        sector = ProcessSector("p", max_lines_count=2, history=history)
+        sector.feed("".join(_line(i) + "\n" for i in range(LINES_COUNT)))
+        self.assertGreater(history.spilled_lines_count, 2)
+
+        sector.view_history(0)
+        self.assertEqual([line.text.text for line in sector.lines.values()], [_line(0), _line(1)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import unittest
+from subprocess import Popen, PIPE
+
+from textboard.board import ProcessSector
+from textboard.mux import ProcessMultiplexer
+
+# Closes its output and keeps running for a while
+DETACHED_CHILD = "import os, time; print('done', flush=True); os.close(1); time.sleep(1); exit(3)"
+
+class ClosedOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.mux = ProcessMultiplexer()
+        self.addCleanup(self.mux.close)
+        self.sector = ProcessSector("child")
+        self.proc = Popen([sys.executable, "-c", DETACHED_CHILD], stdout=PIPE)
+        self.addCleanup(self.proc.wait)
+        self.mux.track(self.sector, self.proc)
+
+    def test_poll_doesnt_wait_for_the_process(self):
+        start = time.time()
+        while self.mux.tracked_count:
+            self.mux.poll(0.1)
+        self.assertLess(time.time() - start, 0.8)
+        self.assertTrue(self.proc.stdout.closed)
+        self.assertNotIn("child", self.mux.exit_codes)
+
+    def test_run_collects_the_exit_code(self):
+        self.mux.run()
+        self.assertEqual(self.mux.exit_codes, {"child": 3})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from textboard.board import BoardLine, FileTailSector, PlainTextLine, ProcessSector
+from textboard.filters import LineFilter
+
+def _texts(sector):
+    return [line.text.text for line in sector.lines.values()]
+
+class HistoryViewTest(unittest.TestCase):
+    def test_view_live_keeps_filtered_lines(self):
+        sector = ProcessSector("p", max_lines_count=3, history=True, line_filter=LineFilter("ERROR"))
+        sector.feed("".join("{kind} {i}\n".format(kind="ERROR" if i % 5 == 0 else "info", i=i) for i in range(1, 20)))
+        self.assertEqual(_texts(sector), ["ERROR 5", "ERROR 10", "ERROR 15"])
+
+        sector.view_history(0)
+        self.assertEqual(_texts(sector), ["info 1", "info 2", "info 3"])
+        sector.feed("ERROR 20\ninfo 21\n")
+        self.assertEqual(_texts(sector), ["info 1", "info 2", "info 3"])
+        sector.view_live()
+        self.assertEqual(_texts(sector), ["ERROR 10", "ERROR 15", "ERROR 20"])
+
+    def test_view_live_keeps_collapsed_lines(self):
+        sector = ProcessSector("p", max_lines_count=3, history=True, collapse=True)
+        sector.feed("x\n" * 50)
+        self.assertEqual(_texts(sector), ["x (x50)"])
+
+        sector.view_history(0)
+        self.assertEqual(_texts(sector), ["x (x50)"])
+        sector.view_live()
+        self.assertEqual(_texts(sector), ["x (x50)"])
+
+    def test_history_view_collapses_repeated_lines(self):
+        sector = ProcessSector("p", max_lines_count=2, history=True, collapse=True)
+        sector.feed("a\na\nb\nc\nc\nc\nd\n")
+        sector.view_history(0)
+        self.assertEqual(_texts(sector), ["a (x2)", "b"])
+        sector.view_history(3)
+        self.assertEqual(_texts(sector), ["c (x3)", "d"])
+
+class RingTest(unittest.TestCase):
+    def _lines(self, sector):
+        return list(sector._iter_lines())
+
+    def test_replaced_lines_reuse_the_ring_slots(self):
+        sector = ProcessSector("p", max_lines_count=3)
+        ring = list(sector._ring)
+        sector.feed("1\n2\n3\n")
+        self.assertEqual(self._lines(sector), ring)
+
+        sector.feed("4\n5\n")
+        self.assertEqual(_texts(sector), ["3", "4", "5"])
+        self.assertEqual(self._lines(sector), [ring[2], ring[0], ring[1]])
+        self.assertEqual(sector.lines_count, 3)
+
+    def test_line_fields_are_reset_when_a_slot_is_reused(self):
+        TaggedLine = BoardLine().add("tag", size=2).add("text") >> "TaggedLine"
+
+        def tag_errors(line):
+            if line.text.text.startswith("ERROR"):
+                line.tag = "!"
+
+        sector = ProcessSector("p", max_lines_count=1, line_cls=TaggedLine, line_handler=tag_errors)
+        sector.feed("ERROR 1\n")
+        self.assertEqual(self._lines(sector)[0].tag.text, "!")
+        sector.feed("info 2\n")
+        line, = self._lines(sector)
+        self.assertEqual((line.tag.text, line.text.text), ("", "info 2"))
+
+    def test_added_lines_are_never_reused(self):
+        sector = ProcessSector("p", max_lines_count=2)
+        added = PlainTextLine.create(text="added")
+        sector.add(added)
+        sector.feed("1\n2\n3\n")
+        self.assertEqual(_texts(sector), ["2", "3"])
+        self.assertNotIn(added, self._lines(sector))
+        self.assertIsNone(added._parent)
+        self.assertEqual(added.text.text, "added")
+
+class NamedLineTest(unittest.TestCase):
+    def test_added_line_is_an_attribute(self):
+        sector = ProcessSector("p", max_lines_count=2)
+        status = PlainTextLine.create("status", text="running")
+        sector.add(status)
+        self.assertIs(sector.status, status)
+
+        sector.remove("status")
+        self.assertFalse(hasattr(sector, "status"))
+
+    def test_replaced_line_attribute_is_removed(self):
+        sector = ProcessSector("p", max_lines_count=2)
+        sector.add(PlainTextLine.create("status", text="running"))
+        sector.feed("1\n2\n")
+        self.assertFalse(hasattr(sector, "status"))
+
+    def test_cleared_line_attribute_is_removed(self):
+        sector = ProcessSector("p", max_lines_count=2)
+        sector.add(PlainTextLine.create("status", text="running"))
+        sector.clear()
+        self.assertFalse(hasattr(sector, "status"))
+
+class CollapseTest(unittest.TestCase):
+    def test_dropped_runs_break_the_previous_run(self):
+        sector = ProcessSector("p", max_lines_count=1, collapse=True)
+        sector.feed("x\n")
+        sector.feed("y\nx\n")
+        self.assertEqual(_texts(sector), ["x"])
+
+    def test_runs_across_feeds_are_collapsed(self):
+        sector = ProcessSector("p", max_lines_count=2, collapse=True)
+        sector.feed("x\nx\n")
+        sector.feed("x\n")
+        self.assertEqual(_texts(sector), ["x (x3)"])
+
+class FileTailSectorTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "log")
+
+    def test_tail_with_filter_scans_for_matching_lines(self):
+        with open(self.path, "w") as fd:
+            for i in range(1000):
+                fd.write("{kind} line {i} {padding}\n".format(kind="ERROR" if i % 100 == 0 else "info", i=i,
+                                                             padding="." * 200))
+        sector = FileTailSector("log", self.path, max_lines_count=3, line_filter=LineFilter("ERROR"))
+        self.addCleanup(sector.close)
+        sector.poll()
+        self.assertEqual([text.split()[2] for text in _texts(sector)], ["700", "800", "900"])
+
+if __name__ == "__main__":
+    unittest.main()
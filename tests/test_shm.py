@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+
+import unittest
+
+from textboard.board import PlainTextLine
+
+try:
+    from textboard.shm import SharedBoardModel
+except ImportError:
+    SharedBoardModel = None
+
+@unittest.skipIf(SharedBoardModel is None, "multiprocessing.shared_memory is not available")
+class InterruptedWriteTest(unittest.TestCase):
+    def setUp(self):
+        self.model = SharedBoardModel(slots_count=2, slot_size=16)
+        self.addCleanup(self.model.close)
+        self.addCleanup(self.model.unlink)
+        self.line = PlainTextLine.create(text="Idle")
+        self.model.bind(0, self.line)
+
+    def _interrupt_write(self, slot):
+        """Leave the slot in the middle of a write, as a writer that died would"""
+        self.model._gens[slot] += 1
+
+    def test_read_of_interrupted_write_returns(self):
+        self.model.write(0, "done")
+        self._interrupt_write(0)
+        self.assertIsNone(self.model.read(0))
+
+    def test_sync_skips_interrupted_write_until_it_ends(self):
+        self._interrupt_write(0)
+        self.model.sync()
+        self.assertEqual(self.line.get("text").text, "Idle")
+        self.assertEqual(self.model.sync(), 0)
+
+        self.model.write(0, "done")
+        self.model.sync()
+        self.assertEqual(self.line.get("text").text, "done")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,3 @@
-__version__ = '1.0.0'
+__version__ = '1.1.0'
 
 __all__ = ['ansi', 'board']
\ No newline at end of file
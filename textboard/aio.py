@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+from textboard.board import ProcessSector, BOARD_DEFAULT_FPS, PROCESS_SECTOR_DRAIN_CHUNK_SIZE
+
+class AsyncProcessSector(ProcessSector):
+    """AsyncProcessSector - A ProcessSector that is updated from asyncio streams"""
+
+    async def update_from_stream(self, stream):
+        """update_from_stream(self, stream)
+        Update the sector with the lines of the given stream as they arrive, until the end of the stream.
+        The stream is read in large chunks, so lines of any length are accepted and a burst of output is
+        turned into board lines in bulk.
+
+        stream - An asyncio.StreamReader or an asyncio.subprocess.Process that was created with stdout=PIPE
+        """
+        if isinstance(stream, asyncio.subprocess.Process):
+            stream = stream.stdout
+        while True:
+            chunk = await stream.read(PROCESS_SECTOR_DRAIN_CHUNK_SIZE)
+            if not chunk:
+                self.feed_eof()
+                return
+            self.feed(chunk)
+
+class AsyncBoardDriver(object):
+    def __init__(self, board, fps=BOARD_DEFAULT_FPS):
+        """AsyncBoardDriver(self, board, fps=BOARD_DEFAULT_FPS)
+        Creates a driver that updates the sectors of a board from asyncio streams and draws
+        the board on a timer, all from a single event loop.
+
+        board - The board to draw
+        fps - The maximum number of frames to draw per second (default: BOARD_DEFAULT_FPS)
+        """
+        self._board = board
+        self._frame_interval = 1.0 / fps
+        self._tracked = []
+
+    @property
+    def board(self):
+        """The board property of the AsyncBoardDriver"""
+        return self._board
+
+    def track(self, sector, stream):
+        """track(self, sector, stream) -> self
+        Track the given stream with the given sector
+
+        sector - The AsyncProcessSector to update
+        stream - An asyncio.StreamReader or an asyncio.subprocess.Process that was created with stdout=PIPE
+        """
+        self._tracked.append((sector, stream))
+        return self
+
+    async def run(self, clear_screen=False):
+        """run(self, clear_screen=False)
+        Update the tracked sectors until all of the tracked streams are exhausted, while
+        drawing the board. The board is drawn one last time before returning.
+
+        clear_screen - indicates wether the screen should be cleared before the first frame (default: False)
+        """
+        render = asyncio.ensure_future(self._render(clear_screen))
+        try:
+            await asyncio.gather(*[sector.update_from_stream(stream) for sector, stream in self._tracked])
+        finally:
+            render.cancel()
+            try:
+                await render
+            except asyncio.CancelledError:
+                pass
+            self._board.draw()
+
+    async def _render(self, clear_screen):
+        """_render(self, clear_screen)
+        Draw the board on every frame interval
+
+        clear_screen - indicates wether the screen should be cleared before the first frame
+        """
+        while True:
+            self._board.draw(clear_screen)
+            clear_screen = False
+            await asyncio.sleep(self._frame_interval)
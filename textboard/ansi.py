@@ -36,141 +36,194 @@ class _ANSI(object):
         return cls._ESC + action
 
     @classmethod
-    def _exec_esc(cls, action):
-        """_exec_esc(cls, action)
-        Execute the given action using ANSI escape sequence
+    def _write(cls, esc, frame=None):
+        """_write(cls, esc, frame=None) -> str
+        Print the given escape sequence or append it to the given frame, the escape sequence is returned.
+        When frame is False, the escape sequence is only returned.
+
+        esc - The escape sequence to write
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
+        """
+        if frame is None:
+            print(esc, end="")
+        elif frame is not False:
+            frame.append(esc)
+        return esc
+
+    @classmethod
+    def _exec_esc(cls, action, frame=None):
+        """_exec_esc(cls, action, frame=None) -> str
+        Execute the given action using ANSI escape sequence, the escape sequence is returned
 
         action - The action to execute
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        print(cls._get_esc(action), end="")
+        return cls._write(cls._get_esc(action), frame)
 
     @classmethod
-    def scrn_reset(cls, scrollback_erase=False):
-        """scrn_reset(cls, scrollback_erase=False)
+    def scrn_reset(cls, scrollback_erase=False, frame=None):
+        """scrn_reset(cls, scrollback_erase=False, frame=None) -> str
         Clear the screen (Guaranteed to set cursor to the beginning of the screen)
 
         scrollback_erase - Should the scrollback history be erased? (default: False)
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
         action = ScrnClear.ENTIRE if not scrollback_erase else ScrnClear.ENTIRE_W_BUFFER
-        cls.scrn_erase(action)
-        cls.cur_set()
+        return cls.scrn_erase(action, frame) + cls.cur_set(frame=frame)
 
     @classmethod
-    def scrn_clear(cls):
-        """scrn_clear(cls)
+    def scrn_clear(cls, frame=None):
+        """scrn_clear(cls, frame=None) -> str
         Clear the screen
+
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls.scrn_erase(ScrnClear.ENTIRE)
+        return cls.scrn_erase(ScrnClear.ENTIRE, frame)
 
     @classmethod
-    def scrn_erase(cls, section):
-        """scrn_erase(cls, section)
+    def scrn_erase(cls, section, frame=None):
+        """scrn_erase(cls, section, frame=None) -> str
         Erase part of the screen
 
         section - Either from cursor to the end of screen, from cursor to the beginning of the screen,
         the whole screen or the whole screen with the scrollback buffer (Use ansi.ScrnClear)
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{s}J".format(s=section.value))
+        return cls._exec_esc("{s}J".format(s=section.value), frame)
 
     @classmethod
-    def ln_clear(cls):
-        """ln_clear(cls)
+    def ln_clear(cls, frame=None):
+        """ln_clear(cls, frame=None) -> str
         Clear the whole line.
+
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls.ln_erase(LineClear.ENTIRE)
+        return cls.ln_erase(LineClear.ENTIRE, frame)
 
     @classmethod
-    def ln_erase(cls, section):
-        """ln_erase(cls, section)
+    def ln_erase(cls, section, frame=None):
+        """ln_erase(cls, section, frame=None) -> str
         Erase part of the line
 
         section - Either from cursor to the end of line, from cursor to the beginning of the line,
         or the whole line
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{s}K".format(s=section.value))
+        return cls._exec_esc("{s}K".format(s=section.value), frame)
 
     @classmethod
-    def cur_set(cls, row=1, col=1):
-        """cur_set(cls, row=1, col=1)
+    def cur_set(cls, row=1, col=1, frame=None):
+        """cur_set(cls, row=1, col=1, frame=None) -> str
         set the cursor position (1,1 is the screen beginning)
 
         row - Cursor row to set (Default: 1)
         col - Cursor column to set (Default: 1)
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{r};{c}H".format(r=row, c=col))
+        return cls._exec_esc("{r};{c}H".format(r=row, c=col), frame)
 
     @classmethod
-    def cur_save(cls):
-        """cur_save(cls)
+    def cur_save(cls, frame=None):
+        """cur_save(cls, frame=None) -> str
         Save cursor position
+
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("s")
+        return cls._exec_esc("s", frame)
 
     @classmethod
-    def cur_restore(cls):
-        """cur_restore(cls)
+    def cur_restore(cls, frame=None):
+        """cur_restore(cls, frame=None) -> str
         Restore cursor position
+
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("u")
+        return cls._exec_esc("u", frame)
 
     @classmethod
-    def cur_forward(cls, by=1):
-        """cur_forward(cls, by=1)
+    def cur_forward(cls, by=1, frame=None):
+        """cur_forward(cls, by=1, frame=None) -> str
         Forward the cursor horizontally by the given number
 
         by - The value to forward the cursor by (default: 1)
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{n}C".format(n=by))
+        return cls._exec_esc("{n}C".format(n=by), frame)
 
     @classmethod
-    def cur_backward(cls, by=1):
-        """cur_backward(cls, by=1)
+    def cur_backward(cls, by=1, frame=None):
+        """cur_backward(cls, by=1, frame=None) -> str
         Move the cursor backwards horizontally by the given number
 
         by - The value to move the cursor backwards by (default: 1)
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{n}D".format(n=by))
+        return cls._exec_esc("{n}D".format(n=by), frame)
 
     @classmethod
-    def cur_horizontal_abs(cls, to=1):
-        """cur_horizontal_abs(cls, to=1)
+    def cur_horizontal_abs(cls, to=1, frame=None):
+        """cur_horizontal_abs(cls, to=1, frame=None) -> str
         Set the cursor horizontal absolute position to the given number
 
         to - The horizontal position to set the cursor to
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{n}G".format(n=by))
+        return cls._exec_esc("{n}G".format(n=to), frame)
 
     @classmethod
-    def cur_up(cls, by=1):
-        """cur_up(cls, by=1)
+    def cur_up(cls, by=1, frame=None):
+        """cur_up(cls, by=1, frame=None) -> str
         Move the cursor N lines backwards
 
         by - The number of lines to go backwards (default: 1)
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{n}A".format(n=by))
+        return cls._exec_esc("{n}A".format(n=by), frame)
 
     @classmethod
-    def cur_down(cls, by=1):
-        """cur_down(cls, by=1)
+    def cur_down(cls, by=1, frame=None):
+        """cur_down(cls, by=1, frame=None) -> str
         Move the cursor N lines forward
 
         by - The number of lines to go forward (default: 1)
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{n}B".format(n=by))
+        return cls._exec_esc("{n}B".format(n=by), frame)
 
     @classmethod
-    def cur_prev_ln(cls, by=1):
-        """cur_prev_ln(cls, by=1)
+    def cur_prev_ln(cls, by=1, frame=None):
+        """cur_prev_ln(cls, by=1, frame=None) -> str
         Same as ANSI.cur_up(by)
+
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{n}F".format(n=by))
+        return cls._exec_esc("{n}F".format(n=by), frame)
 
     @classmethod
-    def cur_next_ln(cls, by=1):
-        """cur_next_ln(cls, by=1)
+    def cur_next_ln(cls, by=1, frame=None):
+        """cur_next_ln(cls, by=1, frame=None) -> str
         Same as ANSI.cur_down(by)
+
+        frame - A list to append the escape sequence to instead of printing it, or False to only return it
+        (default: None - print)
         """
-        cls._exec_esc("{n}E".format(n=by))
+        return cls._exec_esc("{n}E".format(n=by), frame)
 
     @classmethod
     def cur_get_pos(cls):
@@ -200,12 +253,12 @@ class OSXANSI(_ANSI):
         super(self, OSXANSI).__init__()
 
     @classmethod
-    def cur_save(cls):
-        print("\x1b7", end="")
+    def cur_save(cls, frame=None):
+        return cls._write("\x1b7", frame)
 
     @classmethod
-    def cur_restore(cls):
-        print("\x1b8", end="")
+    def cur_restore(cls, frame=None):
+        return cls._write("\x1b8", frame)
 
 class WinANSI(_ANSI):
     """OSXANSI
@@ -271,6 +324,14 @@ class _TextStyle(object):
     _FG = "fg"
     _BG = "bg"
 
+    # The compiled escape sequences of the styles, shared by all of the equal styles
+    _compiled = {}
+    # The compiled transitions between two styles, keyed by the styles' keys
+    _transitions = {}
+
+    # The codes that turn off each of the graphic renderations
+    _OFF_CODES = {1: 22, 2: 22, 3: 23, 4: 24, 5: 25, 6: 25, 9: 29}
+
     def __init__(self, fg=TextColors.none, bg=TextColors.none, 
                 bold=False, faint=False, italic=False, underline=False,
                 blink_slow=False, blink_fast=False, crossed_out=False):
@@ -290,6 +351,8 @@ class _TextStyle(object):
         crossed_out  - Make the string crossed out (default: False)
         """
         self._fmt = {}
+        self._suffix = self._ESC + _TextStyle._CLEAR
+        self._compile()
 
         self.fg = fg
         self.bg = bg
@@ -367,6 +430,7 @@ class _TextStyle(object):
             self._fmt[text_part] = color_convert(color)
         else:
             if text_part in self._fmt: self._fmt.pop(text_part)
+        self._compile()
 
     def _style_setter(self, style, val):
         """_style_setter(self, style, val)
@@ -379,6 +443,21 @@ class _TextStyle(object):
             self._fmt[style.name] = style.value
         else:
             if style.name in self._fmt: self._fmt.pop(style.name)
+        self._compile()
+
+    def _compile(self):
+        """_compile(self)
+        Compile the escape sequence prefix of the configured styles. Equal styles share the same
+        compiled prefix.
+        """
+        key = tuple(sorted(self._fmt.values()))
+        compiled_key = (self._ESC, key)
+        prefix = _TextStyle._compiled.get(compiled_key)
+        if prefix is None:
+            fmt = [str(style) for style in key] or [str(TextColors.none.value)]
+            prefix = _TextStyle._compiled.setdefault(compiled_key, "{esc}{fmt}m".format(esc=self._ESC, fmt=";".join(fmt)))
+        self._key = key
+        self._prefix = prefix
 
     @fg.setter
     def fg(self, val):
@@ -452,16 +531,60 @@ class _TextStyle(object):
         """
         self._style_setter(_TextGraphicRender.crossed_out, val)
 
+    @staticmethod
+    def _code_group(code):
+        """_code_group(code) -> int
+        Returns the code that turns off the given SGR code, codes that are turned off
+        by the same code belong to the same group
+
+        code - The SGR code to get the group of
+        """
+        if 30 <= code <= 37 or 90 <= code <= 97:
+            return 39
+        if 40 <= code <= 47 or 100 <= code <= 107:
+            return 49
+        return _TextStyle._OFF_CODES[code]
+
+    @classmethod
+    def _transition(cls, prev_key, next_key):
+        """_transition(cls, prev_key, next_key) -> str
+        Returns the shortest escape sequence that changes the terminal's graphic state from
+        the state of one style to another. The transitions are cached.
+
+        prev_key - The key of the current style of the terminal (an empty tuple for the default state)
+        next_key - The key of the style to change to
+        """
+        if prev_key == next_key:
+            return ""
+        transition_key = (cls._ESC, prev_key, next_key)
+        transition = _TextStyle._transitions.get(transition_key)
+        if transition is None:
+            reset = ["0"] + [str(code) for code in next_key]
+            codes = reset
+            if not prev_key:
+                # Nothing has to be turned off in the default state
+                codes = [str(code) for code in next_key]
+            else:
+                next_groups = set(cls._code_group(code) for code in next_key)
+                removed = [code for code in prev_key if code not in next_key]
+                off_codes = sorted(set(cls._code_group(code) for code in removed))
+                added = [code for code in next_key if code not in prev_key or cls._code_group(code) in off_codes]
+                # A new color replaces the previous one without turning it off first
+                off_codes = [off for off in off_codes if off not in (39, 49) or off not in next_groups]
+                diff = [str(code) for code in off_codes + sorted(set(added))]
+                if len(";".join(diff)) < len(";".join(reset)):
+                    codes = diff
+            transition = _TextStyle._transitions.setdefault(
+                transition_key, "{esc}{fmt}m".format(esc=cls._ESC, fmt=";".join(codes)))
+        return transition
+
     def format(self, string):
         """format(self, string) -> str
         Return a formatted string of the given string with, a string with the configured styles
 
         string - The string to format with the configured styles
         """
-        fmt = [str(style) for style in self._fmt.values()]
-        if len(fmt) == 0: fmt.append(TextColors.none)
-
-        return "{esc}{fmt}m{string}{esc}{clear}".format(esc=self._ESC, fmt=";".join(fmt), string=string, clear=_TextStyle._CLEAR)
+        return self._prefix + string + self._suffix
 
 class LinuxTextStyle(_TextStyle):
     _ESC = "\033["
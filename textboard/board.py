@@ -2,19 +2,109 @@
 
 from __future__ import print_function
 
+import os
+import re
+import time
+import codecs
+import select
+import threading
+import functools
+
 from copy import copy
+from contextlib import contextmanager
+from itertools import islice
 from  collections import OrderedDict
 from abc import ABCMeta, abstractmethod, abstractproperty
 
-from textboard.ansi import ANSI
+from textboard.ansi import ANSI, TextStyle, LineClear
+from textboard.sink import StdoutSink
+from textboard.history import LineHistory
+from textboard.filters import StreamSearch
 
 LOG_BOARD_DEFAULT_LINES_COUNT = 20
 LOG_BOARD_SECTOR_DEFAULT_LINES_COUNT = 4
+BOARD_DEFAULT_FPS = 20
+PROCESS_SECTOR_DRAIN_CHUNK_SIZE = 64 * 1024
+FILE_TAIL_SECTOR_BLOCK_SIZE = 64 * 1024
+FILE_TAIL_SECTOR_MAX_FILTERED_SCAN_SIZE = 16 * 1024 * 1024
+COLLAPSE_EXACT = "exact"
+COLLAPSE_MASKED = "masked"
+
+_ESC_SEQ_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+# Runs of digits, which also covers the numbers of timestamps, counters and IDs in lines of output
+_COLLAPSE_MASK_RE = re.compile(r"\d+")
 
 def _validate_id_property(cls, _id):
     if not isinstance(_id, bytes) and not isinstance(_id, str):
         raise TypeError("{cls} id should be either a string or bytes".format(cls=cls))
 
+def _printed_len(text):
+    """_printed_len(text) -> int
+    Get the length of the given text as printed on the screen (without escape sequences)
+
+    text - The text to measure
+    """
+    return len(_ESC_SEQ_RE.sub("", text)) if "\x1b" in text else len(text)
+
+class _RenderContext(threading.local):
+    # The FrameStats of the frame that is drawn by the current thread, if any
+    frame_stats = None
+    # Wether a line with computed fields was built since the flag was cleared
+    computed = False
+    # The smallest ttl of the computed fields that were built since it was reset (0 for fields without a ttl)
+    computed_ttl = float("inf")
+
+_render_context = _RenderContext()
+
+class _NoLock(object):
+    """_NoLock - The lock of board objects that are not contained in a board"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NO_LOCK = _NoLock()
+
+class _BoardLock(object):
+    """_BoardLock - The reentrant lock of a board, which knows the thread that holds it"""
+    __slots__ = ("_lock", "_owner", "_depth")
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._owner = None
+        self._depth = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+        self._owner = threading.current_thread()
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if not self._depth:
+            self._owner = None
+        self._lock.release()
+        return False
+
+    @property
+    def owned(self):
+        """The owned property of the _BoardLock
+        indicates wether the lock is held by the current thread
+        """
+        return self._owner is threading.current_thread()
+
+def _locked(method):
+    """_locked(method)
+    A decorator that holds the lock of the board containing the object while the decorated method runs
+    """
+    @functools.wraps(method)
+    def locked_method(self, *args, **kwargs):
+        with self._board_lock():
+            return method(self, *args, **kwargs)
+    return locked_method
+
 def _is_brd_obj(self, obj):
     if not isinstance(obj, BoardObject):
         raise TypeError("Given object is not a board object")
@@ -23,6 +113,13 @@ class BoardObject(object):
     """BoardObject - The abstract class of a board object"""
     __metaclass__ = ABCMeta
 
+    # The time of the oldest ingested output that was not drawn yet, see ProcessSector
+    _ingested_since = None
+    _parent = None
+    _lock = None
+    # Incremented whenever the object is invalidated, so a build that raced with a change is not cached
+    _version = 0
+
     def __init__(self):
         pass
 
@@ -39,11 +136,167 @@ class BoardObject(object):
         pass
 
     @abstractmethod
-    def draw(self):
+    def draw(self, frame=None):
         pass
 
+    def _board_lock(self):
+        """_board_lock(self) -> lock
+        Returns the lock of the board that contains this object
+        """
+        obj = self
+        while obj is not None:
+            if obj._lock is not None:
+                return obj._lock
+            obj = obj._parent
+        return _NO_LOCK
+
+    @contextmanager
+    def batch(self):
+        """batch(self)
+        A context manager that applies all of the updates made inside of it to the containing board at once.
+        The board is not drawn in the middle of a batch, and the structural updates from other threads (adding and
+        removing objects, updating a ProcessSector) wait for the batch to end. Setting a field is not locked,
+        so field updates from other threads are not held back by a batch.
+        """
+        with self._board_lock():
+            yield self
+
+    def _rows_count(self):
+        """_rows_count(self) -> int
+        Returns the number of screen rows drawn by this object.
+        By default the object is drawn to count its rows, subclasses should override it with a cheaper count.
+        """
+        return len(self._build_rows())
+
+    def _build_rows(self, start=0, stop=None):
+        """_build_rows(self, start=0, stop=None) -> list
+        Returns the strings of the screen rows drawn by this object, only the rows
+        in the given range are built. By default the object is drawn to a frame that is split into rows.
+
+        start - The index of the first row to build (default: 0)
+        stop - The index of the row to stop at (default: None - The last row)
+        """
+        frame = []
+        self.draw(frame)
+        rows = "".join(frame).split("\n")
+        if rows[-1] == "":
+            rows.pop()
+        return rows[max(0, start):stop]
+
+class _FieldAttribute(object):
+    """_FieldAttribute - The descriptor of a BoardLine field attribute.
+    Getting the attribute returns the field and setting it with a text sets the field's text.
+    A field that the line shares with its prototype is copied to the line before it is returned or changed.
+    """
+    __slots__ = ("_field_id", )
+
+    def __init__(self, field_id):
+        self._field_id = field_id
+
+    def __get__(self, line, cls):
+        if line is None:
+            return self
+        try:
+            field = line._fields[self._field_id]
+        except KeyError:
+            raise AttributeError("Line has no field '{field}'".format(field=self._field_id))
+        if field._line is not line:
+            field = line._own_field(self._field_id)
+        return field
+
+    def __set__(self, line, value):
+        try:
+            field = line._fields[self._field_id]
+        except KeyError:
+            field = None
+        if value.__class__ is str and field is not None and field._delegate is _EMPTY_FIELD_DELEGATE:
+            # The fast path of setting a text to a field without a delegate
+            if value != field._text:
+                if field._line is not line:
+                    field = line._own_field(self._field_id)
+                if field._text.__class__ is ComputedText:
+                    field.text = value
+                    return
+                field._text = value
+                field._built = None
+                line.invalidate()
+        elif isinstance(value, BoardLine.LineField):
+            line._set_field(value)
+        elif field is None:
+            raise AttributeError("Line has no field '{field}'".format(field=self._field_id))
+        else:
+            if field._line is not line:
+                field = line._own_field(self._field_id)
+            field.text = value
+
+    def __delete__(self, line):
+        line.remove(self._field_id)
+
+# The BoardLine subclasses that were derived for adding fields to lines, by their base class and field ID
+_field_layouts = {}
+
+def _field_layout(cls, field_id):
+    """_field_layout(cls, field_id) -> BoardLine subclass
+    Get a subclass of the given BoardLine class with an attribute for the given field.
+    Lines are moved to such subclasses when fields are added to them, so the fields are
+    accessed through their class attributes.
+
+    cls - The BoardLine class to derive
+    field_id - The ID of the added field
+    """
+    layout = _field_layouts.get((cls, field_id))
+    if layout is None:
+        layout = type(cls.__name__, (cls, ), {field_id: _FieldAttribute(field_id), "__module__": cls.__module__})
+        _field_layouts[(cls, field_id)] = layout
+    return layout
+
+class ComputedText(object):
+    """ComputedText
+    The text of a field that is computed by a callable when the field's line is drawn, instead of being set
+    """
+    __slots__ = ("_func", "_ttl", "_value", "_expires")
+
+    def __init__(self, func, ttl=None):
+        """ComputedText(self, func, ttl=None)
+        Creates a computed text. Set it as the text of fields (of any number of lines) and the callable is called
+        only when a line with one of the fields is drawn, the lines that are not drawn never call it.
+
+        func - A callable that returns the text
+        ttl - The time in seconds to reuse the returned text for, so the callable is called at most once in
+        that interval by all of the fields that share the computed text (default: None - called on every draw)
+        """
+        self._func = func
+        self._ttl = ttl
+        self._value = None
+        self._expires = 0
+
+    @property
+    def ttl(self):
+        """The ttl property of the ComputedText"""
+        return self._ttl
+
+    def value(self):
+        """value(self) -> str
+        Returns the text, calling the callable unless the text it previously returned is still valid
+        """
+        if self._ttl is None:
+            return self._func()
+        now = time.time()
+        if now >= self._expires:
+            self._value = self._func()
+            self._expires = now + self._ttl
+        return self._value
+
+    def expire(self):
+        """expire(self)
+        Make the next draw call the callable, even if the ttl has not passed yet
+        """
+        self._expires = 0
+
 class BoardLine(BoardObject):
     class LineField(object):
+        __slots__ = ("_id", "_size", "_width", "_text", "_style", "_delegate", "_line", "_built", "_value")
+
         class Delegate(object):
             """The abstract class of a LineField delegate. The delegate
             is used to manipultae the field on different events of the field
@@ -65,16 +318,21 @@ class BoardLine(BoardObject):
 
             field_id - The ID to access the field inside the line
             size - The size of the field in the line (default: None - Unlimited)
-            text - The text of the field (default: empty)
+            text - The text of the field, or a ComputedText that is computed when the field's line is drawn (default: empty)
             style - The text style of the field (Default: None - the terminal's current style)
             delegate - The field delegate.
             """
             _validate_id_property(self.__class__, field_id)
             self._id = field_id
             self._size = size
+            # The width the text is padded to, or None if the size is a format spec (e.g. ">5")
+            self._width = size if isinstance(size, int) else 0 if size is None else None
             self._text = text
             self._style = style
-            self._delegate = delegate if delegate is not None else EmptyFieldDelegate()
+            self._delegate = delegate if delegate is not None else _EMPTY_FIELD_DELEGATE
+            self._line = None
+            self._built = None
+            self._value = None
 
         @property
         def id(self):
@@ -88,7 +346,7 @@ class BoardLine(BoardObject):
 
         @property
         def text(self):
-            """The text property of the LineField"""
+            """The text property of the LineField, a string or a ComputedText"""
             return self._text
 
         @property
@@ -109,8 +367,17 @@ class BoardLine(BoardObject):
             """
             if isinstance(val, bytes):
                 val = val.decode("utf-8")
-            self._text = val
-            self._delegate.on_text_change(self)
+            if val != self._text:
+                computed = val.__class__ is ComputedText or self._text.__class__ is ComputedText
+                self._text = val
+                self._built = None
+                self._value = None
+                if self._line is not None:
+                    if computed:
+                        self._line._update_computed()
+                    self._line.invalidate()
+            if self._delegate is not _EMPTY_FIELD_DELEGATE:
+                self._delegate.on_text_change(self)
 
         @style.setter
         def style(self, val):
@@ -119,6 +386,7 @@ class BoardLine(BoardObject):
             val - The new style to set
             """
             self._style = val
+            self.invalidate()
 
         @delegate.setter
         def delegate(self, val):
@@ -128,14 +396,73 @@ class BoardLine(BoardObject):
             """
             self._delegate = val
 
+        def invalidate(self):
+            """invalidate(self)
+            Mark the field and its containing line as changed, so they will be rebuilt on the next draw.
+            Should be called after modifying the field's style in place.
+            """
+            self._built = None
+            if self._line is not None:
+                self._line.invalidate()
+
         def build(self):
             """build(self)
-            Build the string of the LineField
+            Build the string of the LineField, with the escape sequences of its style
+            """
+            if self._style is not None:
+                return self._style.format(self._build_text())
+            return self._build_text()
+
+        def _build_text(self):
+            """_build_text(self)
+            Build the padded text of the LineField without its style, the text is cached until the field is changed
+            """
+            built = self._built
+            if built is None:
+                text = field_text = self._text
+                if text.__class__ is ComputedText:
+                    if self._value is None:
+                        self._refresh()
+                    text = self._value
+                width = self._width
+                if width is None or text.__class__ is not str:
+                    text = "{text:{size}}".format(text=text, size=self.size)
+                if "\n" in text:
+                    text = text.replace("\n", "")
+                built = self._built = text.ljust(width) if width else text
+                # The text may have been set by another thread while it was built, the cache is then dropped
+                if self._text is not field_text:
+                    self._built = None
+            return built
+
+        def _clone(self):
+            """_clone(self) -> LineField
+            Create a copy of the field that is not contained in any line, its built text is copied as well
             """
-            text = "{text:{size}}".format(text=self.text, size=self.size).replace("\n", '')
-            if self.style is not None:
-                text = self.style.format(text)
-            return text
+            field = self.__class__.__new__(self.__class__)
+            field._id = self._id
+            field._size = self._size
+            field._width = self._width
+            field._text = self._text
+            field._style = self._style
+            field._delegate = self._delegate
+            field._line = None
+            field._built = self._built
+            field._value = self._value
+            return field
+
+        def _refresh(self):
+            """_refresh(self) -> bool
+            Compute the value of the field's ComputedText, returns wether it was changed since the previous refresh
+            """
+            value = self._text.value()
+            if value is None:
+                value = ""
+            if value != self._value:
+                self._value = value
+                self._built = None
+                return True
+            return False
 
         @classmethod
         def create_from(cls, field):
@@ -146,6 +473,9 @@ class BoardLine(BoardObject):
             """
             return cls(field.id, field.size, field.text, field.style, field.delegate)
 
+    # Wether any of the line's fields has a ComputedText
+    _computed = False
+
     def __init__(self, line_id=None):
         """BoardLine(line_id=None)
         Creates a board line
@@ -157,10 +487,12 @@ class BoardLine(BoardObject):
         if line_id is not None:
             _validate_id_property(self.__class__, line_id)
         self._id = line_id
+        self._parent = None
+        self._cache = None
         if not hasattr(self, "_fields"):
             self._fields = OrderedDict()
         else:
-            self._copy_fields(self._fields)
+            self._share_fields(self._fields, self._computed)
 
     def _copy_fields(self, fields_to_copy):
         """_copy_fields(self, fields_to_copy)
@@ -168,10 +500,57 @@ class BoardLine(BoardObject):
 
         fields_to_copy - The fields to copy into this line's field dictionary
         """
-        fields = [field for field in fields_to_copy.values()]
+        fields = [field._clone() for field in fields_to_copy.values()]
         self._fields = OrderedDict()
+        cls = self.__class__
         for field in fields:
-            self.add(field.id, field.size, field.text, field.style, field.delegate)
+            if isinstance(getattr(cls, field._id, None), _FieldAttribute):
+                self._fields[field._id] = field
+                field._line = self
+            else:
+                self._set_field(field)
+                cls = self.__class__
+        self._update_computed()
+        self.invalidate()
+
+    def _share_fields(self, fields_to_share, computed):
+        """_share_fields(self, fields_to_share, computed)
+        Set the fields of the given prototype fields dictionary as this line's fields, without copying them.
+        A shared field is copied to the line only when it is accessed through the line (copy on write),
+        except for the computed fields which are copied right away, since each line tracks their values.
+
+        fields_to_share - The prototype fields dictionary, of the line's class or of a prototype line
+        computed - Wether any of the prototype fields has a ComputedText
+        """
+        self._fields = fields_to_share.copy()
+        self._computed = computed
+        if computed:
+            for field_id, field in fields_to_share.items():
+                if field._text.__class__ is ComputedText:
+                    self._own_field(field_id)
+
+    def _own_field(self, field_id):
+        """_own_field(self, field_id) -> LineField
+        Get the requested field of this line, copying it to the line first if it is shared with a prototype
+
+        field_id - The ID of the field
+        """
+        field = self._fields[field_id]
+        if field._line is not self:
+            field = field._clone()
+            field._line = self
+            self._fields[field_id] = field
+        return field
+
+    def _prototype_copy(self):
+        """_prototype_copy(self) -> BoardLine
+        Create a line of the same class and ID that shares the fields of this line, the fields are copied
+        only when they are accessed through the new line. Should be used only with lines that are never changed.
+        """
+        line = self.__class__(self._id)
+        line._share_fields(self._fields, self._computed)
+        line._cache = self._cache
+        return line
 
     @property
     def id(self):
@@ -188,6 +567,7 @@ class BoardLine(BoardObject):
         """The max lines count property of the BoardLine"""
         return self.lines_count
 
+    @_locked
     def add(self, field_id, size=None, text="", style=None, delegate=None):
         """add(self, field_id, size=None, text="") -> self
         Add a field to the board line
@@ -199,18 +579,63 @@ class BoardLine(BoardObject):
         delegate - The delegate of the field
         """
         field = BoardLine.LineField(field_id, size=size, text=text, style=style, delegate=delegate)
-        setattr(self, field_id, field)
+        self._set_field(field)
 
         return self
 
+    def _set_field(self, field):
+        """_set_field(self, field)
+        Set the given field to this line, replacing the line's field with the same ID (if any)
+
+        field - The field to set
+        """
+        field_id = field.id
+        if not isinstance(getattr(self.__class__, field_id, None), _FieldAttribute):
+            if hasattr(self.__class__, field_id) or field_id in self.__dict__:
+                raise ValueError("Can not override BoardLine property with field '{field_name}'".format(field_name=field_id))
+            self.__class__ = _field_layout(self.__class__, field_id)
+
+        self._fields[field_id] = field
+        field._line = self
+        if field._text.__class__ is ComputedText or self._computed:
+            self._update_computed()
+        self.invalidate()
+
     def get(self, field_id):
         """get(self, field_id) -> LineField
         Get the requested field from this line
 
         field_id - The ID of the field to get
         """
-        return self._fields[field_id]
+        return self._own_field(field_id)
 
+    def _update_computed(self):
+        """_update_computed(self)
+        Update wether any of the line's fields has a ComputedText
+        """
+        self._computed = any(field._text.__class__ is ComputedText for field in self._fields.values())
+
+    def _reset_fields(self):
+        """_reset_fields(self)
+        Reset the text and style of the line's fields to the defaults of the line's class
+        """
+        cls_fields = getattr(self.__class__, "_fields", None)
+        if not cls_fields:
+            return
+        computed_changed = False
+        for field_id, field in self._fields.items():
+            cls_field = cls_fields.get(field_id)
+            if cls_field is not None and (field._text is not cls_field._text or field._style is not cls_field._style):
+                if field._text.__class__ is ComputedText or cls_field._text.__class__ is ComputedText:
+                    computed_changed = True
+                field._text = cls_field._text
+                field._style = cls_field._style
+                field._value = None
+                field.invalidate()
+        if computed_changed:
+            self._update_computed()
+
+    @_locked
     def remove(self, field_id):
         """remove(self, field_id) -> LineField
         Remove a field from the line by its iD, the removed field is returned
@@ -218,44 +643,93 @@ class BoardLine(BoardObject):
         field_id - The ID of the field to remove
         """
         ret_val = self._fields.pop(field_id)
-        delattr(self, field_id)
+        ret_val._line = None
+        if self._computed:
+            self._update_computed()
+        self.invalidate()
         return ret_val
 
+    def invalidate(self):
+        """invalidate(self)
+        Mark the line and its containing objects as changed, so they will be rebuilt on the next draw.
+        """
+        self._version += 1
+        self._cache = None
+        if self._parent is not None:
+            self._parent.invalidate()
+
     def _build(self):
         """_build(self) -> str
-        Returns the string value of this line
+        Returns the string value of this line, the string is cached until the line is changed.
+        The terminal's graphic state is tracked along the line, so only the changes between the styles of
+        adjacent fields are written, and the state is reset at the end of the line only if it was changed.
+        The computed fields are computed on every build, the line is rebuilt only if one of them was changed.
         """
-        line_txt = ""
-        for field in self._fields.values():
-            line_txt += field.build()
+        line_txt = self._cache
+        version = self._version
+        if self._computed:
+            context = _render_context
+            context.computed = True
+            for field in self._fields.values():
+                computed_text = field._text
+                if computed_text.__class__ is ComputedText:
+                    ttl = computed_text._ttl or 0.0
+                    if ttl < context.computed_ttl:
+                        context.computed_ttl = ttl
+                    if field._refresh():
+                        line_txt = None
+        if line_txt is None:
+            frame_stats = _render_context.frame_stats
+            if frame_stats is not None:
+                frame_stats._line_built(self.__class__)
+            parts = []
+            state = ()
+            transition = TextStyle._transition
+            for field in self._fields.values():
+                style = field._style
+                key = () if style is None else style._key
+                if key != state:
+                    parts.append(transition(state, key))
+                    state = key
+                parts.append(field._build_text())
+            if state:
+                parts.append(transition(state, ()))
+            line_txt = self._cache = "".join(parts)
+            # Fields are set without the board's lock, if the line was changed while it was built the
+            # built string is returned for this frame but not cached, and the board is already marked as changed
+            if self._version != version:
+                self._cache = None
 
         return line_txt
 
-    def draw(self):
-        """draw(self)
-        Draw the line to the screen
+    def _rows_count(self):
+        """_rows_count(self) -> int
+        Returns the number of screen rows drawn by this line
         """
-        print(self._build())
+        return 1
 
-    def __setattr__(self, name, value):
-        if hasattr(self, name):
-            attr_to_set = getattr(self, name)
-            if isinstance(value, str) or isinstance(value, bytes):
-                if isinstance(attr_to_set, BoardLine.LineField):
-                    attr_to_set.text = value
-                    return
-            elif isinstance(value, BoardLine.LineField):
-                if not isinstance(attr_to_set, BoardLine.LineField):
-                    raise ValueError("Can not override BoardLine property with field '{field_name}'".format(field_name=name))
+    def _build_rows(self, start=0, stop=None):
+        """_build_rows(self, start=0, stop=None) -> list
+        Returns the strings of the screen rows drawn by this line
 
-        try:
-            if isinstance(value, BoardLine.LineField):
-                self._fields[value.id] = value
-                super(BoardLine, self).__setattr__(name, value)
-        except AttributeError:
-            pass
+        start - The index of the first row to build (default: 0)
+        stop - The index of the row to stop at (default: None - The last row)
+        """
+        if start > 0 or (stop is not None and stop <= 0):
+            return []
+        return [self._build()]
+
+    def draw(self, frame=None):
+        """draw(self, frame=None)
+        Draw the line to the screen
 
-        super(BoardLine, self).__setattr__(name, value)
+        frame - A list to append the line's text to instead of printing it (default: None - print)
+        """
+        if frame is None:
+            print(self._build())
+        else:
+            frame.append(self._build())
+            frame.append("\n")
 
     def __rshift__(self, cls_name):
         """__rshift__(self, cls_name) -> custom BoardLine subclass
@@ -265,7 +739,10 @@ class BoardLine(BoardObject):
 
         cls_name - The name of the newly created subclass
         """
-        return type(cls_name, (self.__class__, ), self.__dict__)
+        cls_dict = dict((name, val) for name, val in self.__dict__.items() if name not in ("_parent", "_cache"))
+        cls_dict["_fields"] = OrderedDict((field.id, BoardLine.LineField.create_from(field)) for field in self._fields.values())
+        cls_dict["_computed"] = self._computed
+        return type(cls_name, (self.__class__, ), cls_dict)
 
     @classmethod
     def create(cls, line_id=None, **fields):
@@ -290,7 +767,9 @@ class BoardLine(BoardObject):
 
         line_id - The id of the line to create, if none is given, a random id will be selected.
         """
-        return self.create(line_id, **self._fields)
+        line = self.__class__(line_id)
+        line._copy_fields(self._fields)
+        return line
 
     @classmethod
     def create_from(cls, line):
@@ -318,6 +797,8 @@ class BoardSector(BoardObject):
         super(BoardSector, self).__init__()
         _validate_id_property(self.__class__, sector_id)
         self._id = sector_id
+        self._parent = None
+        self._rows = None
         if not hasattr(self, "_lines"):
             self._lines = OrderedDict()
         else:
@@ -327,17 +808,20 @@ class BoardSector(BoardObject):
         if not hasattr(self, "_title") or title_line is not None:
             self._title = title_line
         elif hasattr(self, "_title") and self._title != None:
-            self._title = BoardLine.create_from(self._title)
+            self._title = self._title._prototype_copy()
+        if self._title is not None:
+            self._title._parent = self
 
         self._draw_empty = draw_empty
 
     def _copy_lines(self, lines_to_copy):
         """_copy_lines(self, lines_to_copy)
-        Copy the given lines dictionary into this sector's lines dictionary
+        Copy the given prototype lines dictionary into this sector's lines dictionary, the copied lines
+        share the fields of the prototype lines until they are changed
 
         lines_to_copy - The lines to copy into this sector's field dictionary
         """
-        lines = [line.__class__.create_from(line) for line in lines_to_copy.values()]
+        lines = [line._prototype_copy() for line in lines_to_copy.values()]
         self._lines = OrderedDict()
         self.add(*lines)
 
@@ -380,23 +864,28 @@ class BoardSector(BoardObject):
         """
         return self._draw_empty
 
+    @_locked
     def add(self, *lines):
         """add(self, *lines) -> self
         Add line(s) to this sector
 
         *lines - The line(s) to add to the sector
         """
+        max_lines_count = self._max_lines_count
         for line in lines:
-            if self.lines_count >= self.max_lines_count:
+            if len(self._lines) >= max_lines_count:
                 raise OverflowError("Board sector '{sector}' has reached the maximum lines count of {max_cnt}".format(sector=self.id, 
                                                                                                                    max_cnt=self.max_lines_count))
-            if line.id in self._lines:
+            line_id = line.id
+            if line_id in self._lines:
                 raise ValueError("Board sector '{sector}' already contains a line with the ID '{line.id}'".format(sector=self.id, line=line))
 
-            self._lines[line.id] = line
-            if not isinstance(line.id, int):
-                setattr(self, line.id, line)
+            self._lines[line_id] = line
+            line._parent = self
+            if not isinstance(line_id, int):
+                setattr(self, line_id, line)
 
+        self.invalidate()
         return self
 
     def get(self, line_id):
@@ -407,6 +896,7 @@ class BoardSector(BoardObject):
         """
         return self._lines[line_id]
 
+    @_locked
     def remove(self, *lines_ids):
         """remove(self, *lines_ids)
         Remove line(s) from the sector by ID(s)
@@ -414,33 +904,87 @@ class BoardSector(BoardObject):
         *lines_ids - The ID(s) of the line(s) to remove
         """
         for line_id in lines_ids:
-            self._lines.pop(line_id)
+            self._lines.pop(line_id)._parent = None
+            if not isinstance(line_id, int) and line_id in self.__dict__:
+                delattr(self, line_id)
+        self.invalidate()
 
+    @_locked
     def clear(self):
         """clear(self)
         Clear all of the lines in this sector
         """
-        self.lines.clear()
+        self.remove(*self._lines.keys())
 
-    def draw(self):
-        """draw(self)
-        Draw the sector to the screen
+    def _iter_lines(self):
+        """_iter_lines(self) -> iterator
+        Iterate over the lines of the sector, by their drawing order
         """
-        if self._has_title:
-            self.title.draw()
-        for line in self.lines.values():
-            line.draw()
-        if self.draw_empty:
-            print("\n"*(self.max_lines_count-self.lines_count), end="")
+        return iter(self._lines.values())
 
-    def __setattr__(self, name, value):
-        try:
-            if name in self._lines:
-                super(BoardSector, self).__setattr__(name, self._lines[name])
-        except AttributeError:
-            pass
+    def invalidate(self):
+        """invalidate(self)
+        Mark the sector and its containing board as changed, so they will be rebuilt on the next draw.
+        """
+        self._version += 1
+        self._rows = None
+        if self._parent is not None:
+            self._parent.invalidate()
+
+    def _rows_count(self):
+        """_rows_count(self) -> int
+        Returns the number of screen rows drawn by this sector, empty rows included if draw_empty is set
+        """
+        return self.max_lines_count if self.draw_empty else self.lines_count
 
-        super(BoardSector, self).__setattr__(name, value)
+    def _build_rows(self, start=0, stop=None):
+        """_build_rows(self, start=0, stop=None) -> list
+        Returns the strings of the screen rows drawn by this sector, empty rows included
+        if draw_empty is set. The rows of the whole sector are cached until the sector is changed,
+        if only part of the rows is requested, only the lines in that part are built.
+
+        start - The index of the first row to build (default: 0)
+        stop - The index of the row to stop at (default: None - The last row)
+        """
+        rows_count = self._rows_count()
+        start = max(0, start)
+        stop = rows_count if stop is None else min(stop, rows_count)
+        if self._rows is not None:
+            return self._rows if start == 0 and stop == rows_count else self._rows[start:stop]
+        if start >= stop:
+            return []
+
+        version = self._version
+        context = _render_context
+        computed = context.computed
+        context.computed = False
+        title_rows = int(self._has_title)
+        rows = [self.title._build()] if title_rows and start == 0 else []
+        first_line = max(0, start - title_rows)
+        rows.extend(line._build() for line in islice(self._iter_lines(), first_line, max(0, stop - title_rows)))
+        rows.extend([""] * (stop - start - len(rows)))
+        # The rows of sectors with computed fields are not cached, so the fields are computed on every draw
+        if start == 0 and stop == rows_count and not context.computed:
+            self._rows = rows
+            if self._version != version:
+                self._rows = None
+        context.computed = computed or context.computed
+        return rows
+
+    def draw(self, frame=None):
+        """draw(self, frame=None)
+        Draw the sector to the screen
+
+        frame - A list to append the sector's text to instead of printing it (default: None - print)
+        """
+        rows = self._build_rows()
+        if not rows:
+            return
+        if frame is None:
+            print("\n".join(rows))
+        else:
+            frame.append("\n".join(rows))
+            frame.append("\n")
 
     def __rshift__(self, cls_name):
         """__rshift__(self, cls_name) -> custom BoardSector subclass
@@ -450,14 +994,157 @@ class BoardSector(BoardObject):
 
         cls_name - The name of the newly created subclass
         """
-        return type(cls_name, (self.__class__, ), self.__dict__)
+        cls_dict = dict(self.__dict__)
+        # The lines of the class are a snapshot of the sector's lines, that the instances share as prototypes
+        cls_dict["_lines"] = OrderedDict((line_id, line.__class__.create_from(line)) for line_id, line in self._lines.items())
+        if self._title is not None:
+            cls_dict["_title"] = self._title.__class__.create_from(self._title)
+        cls_dict["_parent"] = None
+        cls_dict["_rows"] = None
+        return type(cls_name, (self.__class__, ), cls_dict)
+
+class FrameStats(object):
+    """FrameStats
+    The statistics of a single drawn frame of a board
+    """
+    __slots__ = ("build_time", "write_time", "chars_written", "lines_built", "rows_drawn", "rows_written",
+                 "lines_built_by_class", "build_time_by_object", "ingestion_lags")
+
+    def __init__(self, detailed=False):
+        """FrameStats(self, detailed=False)
+        Create empty frame statistics
+
+        detailed - Collect the rebuilt lines by their class and the build time by board object (default: False)
+        """
+        self.build_time = 0.0
+        self.write_time = 0.0
+        self.chars_written = 0
+        self.lines_built = 0
+        self.rows_drawn = 0
+        self.rows_written = 0
+        self.lines_built_by_class = {} if detailed else None
+        self.build_time_by_object = {} if detailed else None
+        self.ingestion_lags = {}
+
+    @property
+    def rows_reused(self):
+        """The rows reused property of the FrameStats
+        The number of drawn rows that were not rebuilt for the frame
+        """
+        return max(0, self.rows_drawn - self.lines_built)
+
+    def _line_built(self, line_cls):
+        self.lines_built += 1
+        if self.lines_built_by_class is not None:
+            name = line_cls.__name__
+            self.lines_built_by_class[name] = self.lines_built_by_class.get(name, 0) + 1
+
+    def __repr__(self):
+        return "<FrameStats build={build:.6f}s write={write:.6f}s chars={chars} built={built} rows={rows}>".format(
+            build=self.build_time, write=self.write_time, chars=self.chars_written,
+            built=self.lines_built, rows=self.rows_drawn)
+
+class RenderStats(object):
+    """RenderStats
+    The accumulated render counters of a board
+    """
+    __slots__ = ("frames_drawn", "frames_skipped", "frames_coalesced", "build_time", "write_time", "chars_written",
+                 "lines_built", "rows_drawn", "rows_written", "max_ingestion_lag", "detailed", "last_frame")
+
+    def __init__(self, detailed=False):
+        """RenderStats(self, detailed=False)
+        Create zeroed render counters
+
+        detailed - Collect the rebuilt lines by their class and the build time by board object for each frame,
+        see FrameStats (default: False)
+        """
+        self.detailed = detailed
+        self.reset()
+
+    def reset(self):
+        """reset(self)
+        Zero the counters
+        """
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+        self.frames_coalesced = 0
+        self.build_time = 0.0
+        self.write_time = 0.0
+        self.chars_written = 0
+        self.lines_built = 0
+        self.rows_drawn = 0
+        self.rows_written = 0
+        self.max_ingestion_lag = 0.0
+        self.last_frame = None
+
+    @property
+    def rows_reused(self):
+        """The rows reused property of the RenderStats
+        The number of drawn rows that were not rebuilt
+        """
+        return max(0, self.rows_drawn - self.lines_built)
+
+    def _add_frame(self, frame_stats):
+        self.frames_drawn += 1
+        self.build_time += frame_stats.build_time
+        self.write_time += frame_stats.write_time
+        self.chars_written += frame_stats.chars_written
+        self.lines_built += frame_stats.lines_built
+        self.rows_drawn += frame_stats.rows_drawn
+        self.rows_written += frame_stats.rows_written
+        if frame_stats.ingestion_lags:
+            self.max_ingestion_lag = max(self.max_ingestion_lag, max(frame_stats.ingestion_lags.values()))
+        self.last_frame = frame_stats
+
+    def __repr__(self):
+        return ("<RenderStats frames={frames} skipped={skipped} coalesced={coalesced} build={build:.6f}s "
+                "write={write:.6f}s chars={chars} built={built} reused={reused}>").format(
+            frames=self.frames_drawn, skipped=self.frames_skipped, coalesced=self.frames_coalesced,
+            build=self.build_time, write=self.write_time, chars=self.chars_written,
+            built=self.lines_built, reused=self.rows_reused)
 
 class TextBoard(BoardObject):
-    def __init__(self, id=None, max_lines_count=LOG_BOARD_DEFAULT_LINES_COUNT):
+    def __init__(self, id=None, max_lines_count=LOG_BOARD_DEFAULT_LINES_COUNT, diff_draw=False, viewport=False,
+                 sink=None, on_frame=None):
+        """TextBoard(self, id=None, max_lines_count=LOG_BOARD_DEFAULT_LINES_COUNT, diff_draw=False, viewport=False,
+                 sink=None, on_frame=None)
+        Creates a text board
+
+        id - The ID of the board (default: None)
+        max_lines_count - The maximum lines count of the board, or the height of the viewport in viewport mode
+        diff_draw - A boolean that indicates wether the board should redraw only the screen rows
+        that were changed since the previous draw (default: False)
+        viewport - A boolean that indicates wether the board may hold more lines than it draws. In this mode
+        only the rows inside the viewport (limited by the height of the sink) are built and drawn, and the
+        viewport is moved with scroll and scroll_to (default: False)
+        sink - The Sink the board is drawn to, see textboard.sink (default: None - the standard output)
+        on_frame - A callable that receives the board and the FrameStats of each drawn frame, it is called after
+        the frame is written and may update or draw the board (default: None)
+        """
         super(TextBoard, self).__init__()
         self._id = id
         self._max_lines_count = max_lines_count
         self._board = OrderedDict()
+        self._lines_count = 0
+        self._diff_draw = diff_draw
+        self._viewport = viewport
+        self._sink = StdoutSink() if sink is None else sink
+        self._scroll_offset = 0
+        self._dirty = True
+        # The number of changes since the previous frame
+        self._changes = 0
+        self._computed = False
+        self._computed_ttl = None
+        self._printed_rows = None
+        self._printed_lens = None
+        self._frame = []
+        self._render_thread = None
+        self._render_request = None
+        self._render_stop = None
+        self._stats = RenderStats()
+        self.on_frame = on_frame
+        self._lock = _BoardLock()
+        self._draw_lock = threading.Lock()
 
     @property
     def id(self):
@@ -467,23 +1154,95 @@ class TextBoard(BoardObject):
     @property
     def lines_count(self):
         """The lines count property of the TextBoard"""
-        count = 0
-        for brd_obj in self._board.values():
-            count += brd_obj.max_lines_count
-        return count
+        return self._lines_count
 
     @property
     def max_lines_count(self):
         """The max lines count property of the TextBoard"""
         return self._max_lines_count
 
+    @property
+    def diff_draw(self):
+        """The diff_draw property of the TextBoard
+        indicates wether only the changed rows are redrawn
+        """
+        return self._diff_draw
+
+    @property
+    def stats(self):
+        """The stats property of the TextBoard
+        The RenderStats counters of the board, set stats.detailed to collect the rebuilt lines by
+        their class and the build time by board object
+        """
+        return self._stats
+
+    @property
+    def sink(self):
+        """The sink property of the TextBoard
+        The Sink the board is drawn to
+        """
+        return self._sink
+
+    @property
+    def viewport(self):
+        """The viewport property of the TextBoard
+        indicates wether only the rows inside the viewport are drawn
+        """
+        return self._viewport
+
+    @property
+    def viewport_height(self):
+        """The viewport height property of the TextBoard
+        The number of rows drawn by the board
+        """
+        if not self._viewport:
+            return self._max_lines_count
+        sink_lines = self._sink_lines()
+        if sink_lines is None:
+            return self._max_lines_count
+        return min(self._max_lines_count, sink_lines)
+
+    def _sink_lines(self):
+        """_sink_lines(self) -> int
+        Returns the height of the screen the board is drawn to, or None if its sink doesn't know it
+        """
+        return getattr(self._sink, "lines", None)
+
+    @property
+    def scroll_offset(self):
+        """The scroll offset property of the TextBoard
+        The index of the first row inside the viewport
+        """
+        return self._scroll_offset
+
+    def scroll_to(self, row):
+        """scroll_to(self, row)
+        Move the viewport so it starts at the given row of the board, the viewport is kept inside the board
+
+        row - The index of the row to move the viewport to
+        """
+        row = max(0, min(row, self._rows_count() - self.viewport_height))
+        if row != self._scroll_offset:
+            self._scroll_offset = row
+            self.invalidate()
+
+    def scroll(self, by):
+        """scroll(self, by)
+        Move the viewport by the given number of rows
+
+        by - The number of rows to move the viewport by, negative values move it up
+        """
+        self.scroll_to(self._scroll_offset + by)
+
     @max_lines_count.setter
     def max_lines_count(self, val):
         """The max lines count property setter of the TextBoard
         
         val - The max lines count to set"""
         self._max_lines_count = val
+        self.invalidate()
 
+    @_locked
     def add(self, *brd_objects):
         """add(self, *brd_objects) -> self
         Add board object(s) to this board
@@ -491,10 +1250,16 @@ class TextBoard(BoardObject):
         *brd_objects - The board object(s) to add
         """
         for brd_object in brd_objects:
-            if self.lines_count + brd_object.max_lines_count > self.max_lines_count:
+            obj_lines_count = brd_object.max_lines_count
+            if not self._viewport and self._lines_count + obj_lines_count > self._max_lines_count:
                 raise OverflowError("Failed to add board object: The board has reached the maximum lines count of {max_cnt}".format(max_cnt=self.max_lines_count))
+            if brd_object.id in self._board:
+                raise ValueError("Board already contains an object with the ID '{obj.id}'".format(obj=brd_object))
             self._board[brd_object.id] = brd_object
+            self._lines_count += obj_lines_count
+            brd_object._parent = self
 
+        self.invalidate()
         return self
 
     def get(self, obj_id):
@@ -505,20 +1270,129 @@ class TextBoard(BoardObject):
         """
         return self._board[obj_id]
 
+    @_locked
     def remove(self, *obj_ids):
-        """remove(self, *obj_ids) -> BoardObject
-        Remove board object(s) from this board
+        """remove(self, *obj_ids) -> list
+        Remove board object(s) from this board, the removed board objects are returned
 
         *obj_ids - The ID(s) of the board object(s) to remove
         """
-        for r_id in r_ids:
-            self._lines.pop(r_id)
-
+        # All of the IDs are checked first, so a missing ID leaves the board unchanged
+        for obj_id in obj_ids:
+            if obj_id not in self._board:
+                raise KeyError(obj_id)
+
+        removed = []
+        for obj_id in obj_ids:
+            brd_obj = self._board.pop(obj_id)
+            self._lines_count -= brd_obj.max_lines_count
+            brd_obj._parent = None
+            removed.append(brd_obj)
+
+        self.invalidate()
+        return removed
+
+    @_locked
     def clear(self):
         """clear(self)
         Clear all of the board objects in this board
         """
+        for brd_obj in self._board.values():
+            brd_obj._parent = None
         self._board.clear()
+        self._lines_count = 0
+        self.invalidate()
+
+    def invalidate(self):
+        """invalidate(self)
+        Mark the board as changed, so it will be redrawn on the next draw.
+        When the board is auto rendered, a draw is requested.
+        """
+        self._changes += 1
+        if not self._dirty:
+            self._dirty = True
+            if self._render_request is not None:
+                self._render_request.set()
+
+    @property
+    def auto_rendering(self):
+        """The auto_rendering property of the TextBoard
+        indicates wether the board is drawn by a background render thread
+        """
+        return self._render_thread is not None
+
+    def start_auto_render(self, fps=BOARD_DEFAULT_FPS, clear_screen=False):
+        """start_auto_render(self, fps=BOARD_DEFAULT_FPS, clear_screen=False)
+        Start drawing the board from a background thread. The thread draws the board whenever
+        it is changed (or a draw is requested), but no more than fps times per second, so
+        multiple updates between two frames are drawn together. While lines with computed fields are drawn,
+        the board is drawn again when the smallest ttl of their fields passes (every frame for fields without a ttl).
+
+        fps - The maximum number of frames to draw per second (default: BOARD_DEFAULT_FPS)
+        clear_screen - indicates wether the screen should be cleared before the first frame (default: False)
+        """
+        if self._render_thread is not None:
+            raise RuntimeError("The board is already auto rendered")
+
+        self._render_request = threading.Event()
+        self._render_stop = threading.Event()
+        self._render_request.set()
+        self._render_thread = threading.Thread(target=self._auto_render, args=(1.0 / fps, clear_screen))
+        self._render_thread.daemon = True
+        self._render_thread.start()
+
+    def stop_auto_render(self):
+        """stop_auto_render(self)
+        Stop the background render thread, the pending changes of the board are drawn before returning.
+        * NOTE: Inside a batch the render thread can't end before the batch does, so it is not waited for.
+        """
+        if self._render_thread is None:
+            return
+
+        self._render_stop.set()
+        self._render_request.set()
+        if not self._lock.owned:
+            self._render_thread.join()
+        self._render_thread = None
+        self._render_request = None
+        self._render_stop = None
+        self.draw()
+
+    def request_draw(self):
+        """request_draw(self)
+        Request the board to be drawn. When the board is auto rendered, the request is
+        handled on the next frame, otherwise the board is drawn immediately.
+        """
+        render_request = self._render_request
+        if render_request is None:
+            self.draw()
+        else:
+            self._dirty = True
+            render_request.set()
+
+    def _auto_render(self, frame_interval, clear_screen):
+        """_auto_render(self, frame_interval, clear_screen)
+        The loop of the background render thread
+
+        frame_interval - The minimal interval between two frames, in seconds
+        clear_screen - indicates wether the screen should be cleared before the first frame
+        """
+        render_request, render_stop = self._render_request, self._render_stop
+        while True:
+            if self._computed:
+                # The computed fields of the drawn lines are refreshed when their smallest ttl passes,
+                # even if nothing else was changed
+                render_request.wait(max(0.0, self._computed_ttl - frame_interval))
+            else:
+                render_request.wait()
+            if render_stop.is_set():
+                return
+            render_request.clear()
+
+            frame_start = time.time()
+            self.draw(clear_screen)
+            clear_screen = False
+            render_stop.wait(frame_interval - (time.time() - frame_start))
 
     def draw(self, clear_screen=False):
         """draw(self, clear_screen=True)
@@ -528,44 +1402,226 @@ class TextBoard(BoardObject):
         first or not. in any case the drawing of the board will start
         from the first line and the previously drawn board will be
         erased. (Default: False)
+        * NOTE: if nothing was changed since the previous draw and the screen is not cleared, nothing is drawn,
+        unless the previous frame had lines with computed fields.
+        * NOTE: The frame is composed while holding the board's lock, so it is a consistent snapshot of the board,
+        but it is written after the lock is released, so updates are not blocked by the terminal.
         """
+        with self._lock:
+            if not self._dirty and not self._computed and not clear_screen:
+                self._stats.frames_skipped += 1
+                return
+
+            self._dirty = False
+            if self._changes > 1:
+                self._stats.frames_coalesced += 1
+            self._changes = 0
+            # The next frame may be composed while this one is written, so it gets a buffer of its own
+            frame, self._frame = self._frame, []
+            frame_stats = _render_context.frame_stats = FrameStats(self._stats.detailed)
+            _render_context.computed = False
+            _render_context.computed_ttl = float("inf")
+            build_start = time.time()
+            try:
+                self._compose_frame(clear_screen, frame, frame_stats)
+            finally:
+                _render_context.frame_stats = None
+                self._computed = _render_context.computed
+                self._computed_ttl = _render_context.computed_ttl
+            ingested = [(obj, obj._ingested_since) for obj in self._board.values() if obj._ingested_since is not None]
+            for obj, ingested_since in ingested:
+                obj._ingested_since = None
+
+            # The draw lock is taken before the board's lock is released, so the frames are written in the order
+            # they were composed. Both locks are always taken in this order, so drawing inside a batch is safe.
+            self._draw_lock.acquire()
+
+        try:
+            write_start = time.time()
+            frame_stats.chars_written = self._write_frame(frame)
+            write_end = time.time()
+            frame_stats.build_time = write_start - build_start
+            frame_stats.write_time = write_end - write_start
+
+            for obj, ingested_since in ingested:
+                frame_stats.ingestion_lags[obj.id] = obj._drawn(ingested_since, write_end)
+
+            self._stats._add_frame(frame_stats)
+        finally:
+            self._frame = frame
+            self._draw_lock.release()
+
+        # The hook is called after the draw lock is released, so it may draw the board
+        if self.on_frame is not None:
+            self.on_frame(self, frame_stats)
+
+    def _compose_frame(self, clear_screen, frame, frame_stats):
+        """_compose_frame(self, clear_screen, frame, frame_stats)
+        Compose the escape sequences and rows of the next frame of the board
+
+        clear_screen - indicates wether the screen should be cleared first or not.
+        frame - The list to compose the frame into
+        frame_stats - The FrameStats of the frame
+        """
+        if self._diff_draw:
+            self._diff_draw_board(clear_screen, frame, frame_stats)
+            return
+
         if clear_screen:
-            ANSI.scrn_reset()
-        else: 
-            ANSI.cur_set()
-            self._erase_printed_board()
+            ANSI.scrn_reset(frame=frame)
+        else:
+            ANSI.cur_set(frame=frame)
+            self._erase_printed_board(frame)
+
+        rows = self._build_visible_rows(frame_stats)
+        if rows:
+            frame.append("\n".join(rows))
+            # A newline after the last row of the screen would scroll the first row of the viewport out of it
+            sink_lines = self._sink_lines() if self._viewport else None
+            if sink_lines is None or len(rows) < sink_lines:
+                frame.append("\n")
+        frame_stats.rows_drawn = frame_stats.rows_written = len(rows)
+
+    def _write_frame(self, frame):
+        """_write_frame(self, frame) -> int
+        Write the composed frame to the board's sink with a single write and flush,
+        the frame is emptied so it could be reused by the next draw. The length of the frame is returned.
+
+        frame - The list of strings composing the frame
+        """
+        data = "".join(frame)
+        self._sink.write(data)
+        self._sink.flush()
+        del frame[:]
+        return len(data)
+
+    def _diff_draw_board(self, clear_screen, frame, frame_stats=None):
+        """_diff_draw_board(self, clear_screen, frame, frame_stats=None)
+        Compose only the rows of the board that were changed since the previous draw.
+        The first draw (or a draw that clears the screen) draws all of the rows.
+
+        clear_screen - indicates wether the screen should be cleared first or not.
+        frame - The list to compose the frame into
+        frame_stats - The FrameStats to count the drawn and written rows in (default: None)
+        """
+        rows = self._build_visible_rows(frame_stats)
+
+        if clear_screen:
+            ANSI.scrn_reset(frame=frame)
+            self._printed_rows = None
+        elif self._printed_rows is None:
+            ANSI.cur_set(frame=frame)
+            self._erase_printed_board(frame)
+
+        # Rows that were not printed on the previous draw are known to be empty
+        printed_rows = self._printed_rows or []
+        printed_lens = self._printed_lens or []
+        missing_rows = len(rows) - len(printed_rows)
+        if missing_rows > 0:
+            printed_rows = printed_rows + [""] * missing_rows
+            printed_lens = printed_lens + [0] * missing_rows
+
+        rows_lens = []
+        rows_written = 0
+        for row, text in enumerate(rows):
+            if printed_rows[row] == text:
+                rows_lens.append(printed_lens[row])
+                continue
+
+            text_len = _printed_len(text)
+            rows_lens.append(text_len)
+            rows_written += 1
+            ANSI.cur_set(row + 1, frame=frame)
+            frame.append(text)
+            if text_len < printed_lens[row]:
+                ANSI.ln_erase(LineClear.CUR_TO_END, frame)
+
+        for row in range(len(rows), len(printed_rows)):
+            ANSI.cur_set(row + 1, frame=frame)
+            ANSI.ln_clear(frame)
+
+        ANSI.cur_set(len(rows) + 1, frame=frame)
+        self._printed_rows = rows
+        self._printed_lens = rows_lens
+        if frame_stats is not None:
+            frame_stats.rows_drawn = len(rows)
+            frame_stats.rows_written = rows_written
+
+    def _rows_count(self):
+        """_rows_count(self) -> int
+        Returns the number of screen rows of all of the board objects
+        """
+        return sum(obj._rows_count() for obj in self._board.values())
 
+    def _build_rows(self, start=0, stop=None, frame_stats=None):
+        """_build_rows(self, start=0, stop=None, frame_stats=None) -> list
+        Returns the strings of the screen rows of the board objects, the objects outside
+        of the given range are not built.
+
+        start - The index of the first row to build (default: 0)
+        stop - The index of the row to stop at (default: None - The last row)
+        frame_stats - Detailed FrameStats to record the build time of each object in (default: None)
+        """
+        build_times = frame_stats.build_time_by_object if frame_stats is not None else None
+        rows = []
+        row = 0
         for obj in self._board.values():
-            obj.draw()
+            if stop is not None and row >= stop:
+                break
+            obj_rows_count = obj._rows_count()
+            if row + obj_rows_count > start:
+                if build_times is None:
+                    rows.extend(obj._build_rows(start - row, None if stop is None else stop - row))
+                else:
+                    build_start = time.time()
+                    rows.extend(obj._build_rows(start - row, None if stop is None else stop - row))
+                    build_times[obj.id] = time.time() - build_start
+            row += obj_rows_count
+        return rows
+
+    def _build_visible_rows(self, frame_stats=None):
+        """_build_visible_rows(self, frame_stats=None) -> list
+        Returns the strings of the screen rows inside the viewport (all of the rows if not in viewport mode)
+
+        frame_stats - Detailed FrameStats to record the build time of each object in (default: None)
+        """
+        if not self._viewport:
+            return self._build_rows(frame_stats=frame_stats)
+        return self._build_rows(self._scroll_offset, self._scroll_offset + self.viewport_height, frame_stats)
 
-    def _erase_printed_board(self):
-        """_erase_printed_board(self)
+    def _erase_printed_board(self, frame=None):
+        """_erase_printed_board(self, frame=None)
         Erase the printed board from the screen.
+
+        frame - A list to append the escape sequences to instead of printing them (default: None - print)
         """
-        ANSI.cur_save()
-        for i in range(self.max_lines_count):
-            ANSI.ln_clear()
-            ANSI.cur_next_ln()
-        ANSI.cur_restore()
+        ANSI.cur_save(frame)
+        erase_line = ANSI.ln_clear(frame=False) + ANSI.cur_next_ln(frame=False)
+        ANSI._write(erase_line * self.viewport_height, frame)
+        ANSI.cur_restore(frame)
 
     def __getattr__(self, name):
         if name in self._board:
             return self._board[name]
 
     def __del__(self):
-        ANSI.cur_down(self.max_lines_count)
+        self._sink.write(ANSI.cur_down(self.viewport_height, frame=False))
 
 def redraws(board, clear_screen=True):
     """redraws(board)
     A decorator that redraws the given board at the end of the
-    decorated function
+    decorated function. If the board is auto rendered, a draw is requested
+    instead and the board is redrawn on its next frame.
 
     board - The board to redraw
     """
     def _exec_and_redraw(func):
         def wrapper(*args, **kwargs):
             ret_val = func(*args, **kwargs)
-            board.draw(clear_screen)
+            if board.auto_rendering:
+                board.request_draw()
+            else:
+                board.draw(clear_screen)
             return ret_val
         return wrapper
     return _exec_and_redraw
@@ -576,15 +1632,34 @@ class EmptyFieldDelegate(LineFieldDelegate):
     def on_text_change(self, field):
         pass
 
+_EMPTY_FIELD_DELEGATE = EmptyFieldDelegate()
+
 """PlainTextLine - The most simple BoardLine one could wish.
 This line has only field named text.
 """
 PlainTextLine = BoardLine().add("text") >> "PlainTextLine"
 
+def _collapse_key_func(collapse):
+    """_collapse_key_func(collapse) -> callable
+    Get the function that returns the collapse key of a line for the given collapse mode of a ProcessSector
+
+    collapse - The collapse mode (None, True, COLLAPSE_EXACT, COLLAPSE_MASKED or a callable)
+    """
+    if collapse is None or collapse is False:
+        return None
+    if collapse is True or collapse == COLLAPSE_EXACT:
+        return lambda line: line
+    if collapse == COLLAPSE_MASKED:
+        return lambda line: _COLLAPSE_MASK_RE.sub("#", line)
+    if callable(collapse):
+        return collapse
+    raise ValueError("Unknown collapse mode: {collapse}".format(collapse=collapse))
+
 class ProcessSector(BoardSector):
     def __init__(self, sector_id, max_lines_count=LOG_BOARD_SECTOR_DEFAULT_LINES_COUNT, title_line=None,
-                 draw_empty=True, line_cls=PlainTextLine, line_handler=None, **line_fields):
-        """__init__(self, sector_id, max_lines_count, title_line, draw_empty, line_cls, line_handler, **line_fields)
+                 draw_empty=True, line_cls=PlainTextLine, line_handler=None, history=None, line_filter=None, collapse=None,
+                 **line_fields):
+        """__init__(self, sector_id, max_lines_count, title_line, draw_empty, line_cls, line_handler, history, line_filter, collapse, **line_fields)
         Creates a ProcessSector which is a subclass of BoardSector
         This is a special sector class dedicated to work with subprocess.Popen that was created with the flags:
         stdout=PIPE and optionally stderr=STDOUT (Both values from the subprocess module)
@@ -597,7 +1672,16 @@ class ProcessSector(BoardSector):
         draw_empty - A boolean that indicates wether or not the empty lines of the sector should be drawn (default: True)
         line_cls - The BoardLine class to use for drawing the tracked process (default: PlainTextLine)
         line_handler - A callable that receives a line and manipulates it as desired
-        **line_fields - kwargs to format the created Boardlines. The values should be either a callable that returns a string or a string.
+        history - Keep the full output in a LineHistory, so lines that were replaced can be viewed with view_history.
+        Either True or a LineHistory instance (default: None - no history is kept)
+        line_filter - A LineFilter that the lines of output must pass to be shown, lines are filtered before
+        a board line is set for them. The history keeps all of the lines (default: None - all lines are shown)
+        collapse - Merge consecutive duplicate lines into one board line with a repeat counter. Either COLLAPSE_EXACT
+        (or True) for identical lines, COLLAPSE_MASKED for lines that are identical after masking their digits
+        (timestamps, counters, etc.), or a callable that returns the key that consecutive lines are compared by
+        (default: None - lines are never collapsed)
+        **line_fields - kwargs to format the created Boardlines. The values should be either a callable that returns a string or a string,
+        the callables are called for each line of output. A ComputedText value is computed only when the line is drawn.
         """
         super(ProcessSector, self).__init__(sector_id, max_lines_count=max_lines_count, title_line=title_line, draw_empty=draw_empty)
         if not hasattr(line_cls, "text"):
@@ -605,6 +1689,243 @@ class ProcessSector(BoardSector):
         self._line_cls = line_cls
         self._line_fields = line_fields
         self._line_handler = line_handler
+        self._ring_ids = set()
+        self._ring = [self._new_ring_line() for i in range(max_lines_count)]
+        self._ring_start = 0
+        self._ring_len = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial_line = ""
+        self._skipped_lines_count = 0
+        self._ingestion_lag = 0.0
+        self._history = LineHistory() if history is True else history
+        self._history_view = None
+        self._view_lines = None
+        self._view_len = 0
+        self._line_filter = line_filter
+        self._collapse_key = _collapse_key_func(collapse)
+        self._last_key = None
+        self._repeat_count = 0
+        self._collapsed_lines_count = 0
+
+    def _new_ring_line(self):
+        """_new_ring_line(self) -> BoardLine
+        Create a line for the lines ring of the sector
+        """
+        line = self._line_cls()
+        line._parent = self
+        self._ring_ids.add(id(line))
+        return line
+
+    def _release_line(self, line):
+        """_release_line(self, line)
+        Detach a line that is no longer shown by the sector, and remove its attribute if it was added with an ID
+        """
+        line._parent = None
+        if not isinstance(line.id, int) and self.__dict__.get(line.id) is line:
+            delattr(self, line.id)
+
+    def _iter_lines(self):
+        """_iter_lines(self) -> iterator
+        Iterate over the lines of the sector, from the oldest to the newest
+        """
+        if self._history_view is not None:
+            return iter(self._view_lines[:self._view_len])
+        ring, start = self._ring, self._ring_start
+        return (ring[(start + i) % len(ring)] for i in range(self._ring_len))
+
+    @property
+    def lines(self):
+        """The lines property of the ProcessSector
+        A new ordered dictionary of the current lines of the sector
+        """
+        return OrderedDict((line.id, line) for line in self._iter_lines())
+
+    @property
+    def lines_count(self):
+        """The lines count property of the ProcessSector"""
+        lines_count = self._ring_len if self._history_view is None else self._view_len
+        return lines_count + int(self._has_title)
+
+    @_locked
+    def add(self, *lines):
+        """add(self, *lines) -> self
+        Add line(s) to this sector, the lines take the place of the sector's preallocated lines
+
+        *lines - The line(s) to add to the sector
+        """
+        for line in lines:
+            if self.lines_count >= self.max_lines_count:
+                raise OverflowError("Board sector '{sector}' has reached the maximum lines count of {max_cnt}".format(sector=self.id, 
+                                                                                                                   max_cnt=self.max_lines_count))
+            index = (self._ring_start + self._ring_len) % len(self._ring)
+            self._ring_ids.discard(id(self._ring[index]))
+            self._ring[index] = line
+            self._ring_len += 1
+            line._parent = self
+            if not isinstance(line.id, int):
+                setattr(self, line.id, line)
+
+        self.invalidate()
+        return self
+
+    def get(self, line_id):
+        """get(self, line_id) -> BoardLine
+        Get a line from the sector by its ID
+
+        line_id - The ID of the line to get
+        """
+        for line in self._iter_lines():
+            if line.id == line_id:
+                return line
+        raise KeyError(line_id)
+
+    @_locked
+    def remove(self, *lines_ids):
+        """remove(self, *lines_ids)
+        Remove line(s) from the sector by ID(s)
+
+        *lines_ids - The ID(s) of the line(s) to remove
+        """
+        removed = [self.get(line_id) for line_id in lines_ids]
+        lines = [line for line in self._iter_lines() if line not in removed]
+        for line in removed:
+            self._release_line(line)
+            self._ring_ids.discard(id(line))
+
+        self._ring_ids = set(id(line) for line in lines if id(line) in self._ring_ids)
+        self._ring = lines + [self._new_ring_line() for i in range(len(self._ring) - len(lines))]
+        self._ring_start = 0
+        self._ring_len = len(lines)
+        self.invalidate()
+
+    @_locked
+    def clear(self):
+        """clear(self)
+        Clear all of the lines in this sector
+        """
+        for line in self._iter_lines():
+            if id(line) not in self._ring_ids and not isinstance(line.id, int):
+                self.__dict__.pop(line.id, None)
+        self._ring_start = 0
+        self._ring_len = 0
+        self._last_key = None
+        self.invalidate()
+
+    @property
+    def skipped_lines_count(self):
+        """The skipped lines count property of the ProcessSector
+        The number of lines that were read by feed or drain_file but were never added to the sector
+        because newer lines replaced them
+        """
+        return self._skipped_lines_count
+
+    @property
+    def collapsed_lines_count(self):
+        """The collapsed lines count property of the ProcessSector
+        The number of repeated lines that were merged into the board line of a previous line
+        """
+        return self._collapsed_lines_count
+
+    @property
+    def history(self):
+        """The history property of the ProcessSector
+        The LineHistory of the sector's output, or None if no history is kept
+        """
+        return self._history
+
+    @property
+    def line_filter(self):
+        """The line filter property of the ProcessSector
+        The LineFilter of the sector, or None if all lines are shown
+        """
+        return self._line_filter
+
+    def search(self, *patterns, **kwargs):
+        """search(self, *patterns, flags=0) -> StreamSearch
+        Create an incremental search of the sector's history, call its update method to get the matches
+        of the output that was added since the previous update
+
+        *patterns - The patterns to search for (strings or compiled patterns)
+        flags - The re flags to compile the patterns with (default: 0)
+        """
+        if self._history is None:
+            raise ValueError("Sector '{sector}' keeps no history".format(sector=self.id))
+        return StreamSearch(self._history, *patterns, **kwargs)
+
+    @property
+    def history_view(self):
+        """The history view property of the ProcessSector
+        The number of the first history line shown by the sector, or None if the sector shows its latest lines
+        """
+        return self._history_view
+
+    @_locked
+    def view_history(self, first_line):
+        """view_history(self, first_line)
+        Show the lines of the history starting at the given line number instead of the latest lines.
+        The history lines are shown in lines of their own, new output keeps updating the latest lines
+        (and the history) while older lines are shown, until view_live is called.
+
+        first_line - The number of the first history line to show, negative numbers count from the end of the history
+        """
+        if self._history is None:
+            raise ValueError("Sector '{sector}' keeps no history".format(sector=self.id))
+        history_len = len(self._history)
+        if first_line < 0:
+            first_line += history_len
+        first_line = max(0, min(first_line, history_len - len(self._ring)))
+        self._history_view = first_line
+        self._show_history_lines(first_line)
+
+    @_locked
+    def view_live(self):
+        """view_live(self)
+        Show the latest lines of the output again, after view_history
+        """
+        if self._history_view is None:
+            return
+        self._history_view = None
+        self.invalidate()
+
+    def _show_history_lines(self, first_line):
+        """_show_history_lines(self, first_line)
+        Show the history lines starting at the given line number in the view lines of the sector,
+        the view lines are created on the first view of the history. Repeated lines are collapsed as the live lines are.
+
+        first_line - The number of the first history line to show
+        """
+        if self._view_lines is None:
+            self._view_lines = []
+            for i in range(len(self._ring)):
+                line = self._line_cls()
+                line._parent = self
+                self._view_lines.append(line)
+        if self._collapse_key is None:
+            runs = ((line, None, 1) for line in self._history.lines(first_line, first_line + len(self._view_lines)))
+        else:
+            runs = self._collapse_runs(self._history.lines(first_line))
+        self._view_len = 0
+        for brd_line, (line, key, repeat) in zip(self._view_lines, runs):
+            self._set_ring_line(brd_line, line, repeat)
+            self._view_len += 1
+        self.invalidate()
+
+    @property
+    def ingestion_lag(self):
+        """The ingestion lag property of the ProcessSector
+        The time in seconds between the ingestion of the oldest output of the last drawn frame and its drawing
+        """
+        return self._ingestion_lag
+
+    def _drawn(self, ingested_since, drawn_time):
+        """_drawn(self, ingested_since, drawn_time) -> float
+        Called by the board after drawing the ingested output of the sector, the ingestion lag is returned
+
+        ingested_since - The time the oldest drawn output was ingested at
+        drawn_time - The time the output was drawn at
+        """
+        self._ingestion_lag = drawn_time - ingested_since
+        return self._ingestion_lag
 
     def update_from_file(self, file):
         """update_from_file(self, file) -> bool
@@ -615,13 +1936,384 @@ class ProcessSector(BoardSector):
         """
         line = file.readline()
         if not line: return False
-        brd_line = self._line_cls()
+        self.update_from_line(line)
+        return True
+
+    @_locked
+    def update_from_line(self, line):
+        """update_from_line(self, line)
+        Update the sector with a single line of output, the oldest line is replaced if the sector is full.
+        The sector's lines are allocated once and reused, so the line's fields are reset to the defaults of the
+        line class before being updated.
+
+        line - The line of output (string or bytes)
+        """
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", "replace")
+        if self._history is not None:
+            self._history.append(line)
+        if self._line_filter is not None and not self._line_filter.match(line):
+            return
+        if self._collapse_key is not None:
+            self._show_line(line, self._collapse_key(line))
+        else:
+            self._show_line(line)
+
+    def _show_line(self, line, key=None, repeat=1):
+        """_show_line(self, line, key=None, repeat=1)
+        Show a line of output in the latest lines of the sector, which are drawn unless the sector shows older
+        lines from its history. When the sector collapses lines and the line's key is the key of the previous line,
+        the previous board line is updated with the line and its repeat counter instead of taking a new board line.
+
+        line - The line of output
+        key - The collapse key of the line (default: None - the line is not collapsed)
+        repeat - The number of consecutive lines with the key that the line stands for (default: 1)
+        """
+        last_line = self._last_ring_line() if key is not None and key == self._last_key else None
+        if last_line is not None:
+            self._repeat_count += repeat
+            self._collapsed_lines_count += repeat
+            self._set_ring_line(last_line, line, self._repeat_count)
+        else:
+            self._last_key = key
+            self._repeat_count = repeat
+            self._collapsed_lines_count += repeat - 1
+            self._set_ring_line(self._next_ring_line(), line, repeat)
+        if self._history_view is not None:
+            return
+        if self._ingested_since is None:
+            self._ingested_since = time.time()
+        self.invalidate()
+
+    def _next_ring_line(self):
+        """_next_ring_line(self) -> BoardLine
+        Returns the ring line to show the next line of output in, the oldest line is replaced if the sector is full
+        """
+        ring = self._ring
+        if self._ring_len < len(ring):
+            brd_line = ring[(self._ring_start + self._ring_len) % len(ring)]
+            self._ring_len += 1
+        else:
+            brd_line = ring[self._ring_start]
+            self._ring_start = (self._ring_start + 1) % len(ring)
+        if id(brd_line) not in self._ring_ids:
+            # A line that was added to the sector is never reused
+            self._release_line(brd_line)
+            index = ring.index(brd_line)
+            brd_line = ring[index] = self._new_ring_line()
+        return brd_line
+
+    def _last_ring_line(self):
+        """_last_ring_line(self) -> BoardLine
+        Returns the ring line of the newest line of output, or None if the newest line was added to the sector
+        """
+        if not self._ring_len:
+            return None
+        brd_line = self._ring[(self._ring_start + self._ring_len - 1) % len(self._ring)]
+        return brd_line if id(brd_line) in self._ring_ids else None
+
+    def _set_ring_line(self, brd_line, line, repeat=1):
+        """_set_ring_line(self, brd_line, line, repeat=1)
+        Reset the given ring line and show a line of output in it
+
+        brd_line - The ring line
+        line - The line of output (string or bytes)
+        repeat - The number of consecutive lines the line stands for, shown in the line's repeat field if it has one,
+        otherwise after the line's text (default: 1)
+        """
+        brd_line._reset_fields()
+        if repeat > 1:
+            counter = "(x{repeat})".format(repeat=repeat)
+            if hasattr(self._line_cls, "repeat"):
+                brd_line.repeat = counter
+            else:
+                line = "{line} {counter}".format(line=line, counter=counter)
         brd_line.text = line
         for field, field_val_getter in self._line_fields.items():
             brd_line.get(field).text = field_val_getter if not callable(field_val_getter) else field_val_getter()
         if self._line_handler is not None: self._line_handler(brd_line)
-        if self.lines_count >= self.max_lines_count:
-            self.lines.popitem(False)
 
-        self.add(brd_line)
-        return True
\ No newline at end of file
+    @_locked
+    def _update_from_lines(self, lines):
+        """_update_from_lines(self, lines)
+        Update the sector with the given lines of output. Only the lines that pass the sector's filter and
+        fit in the sector are turned into board lines, the rest of the lines that passed are counted as skipped.
+
+        lines - A list of lines of output (strings)
+        """
+        if self._history is not None:
+            self._history.extend(lines)
+        if self._line_filter is not None:
+            lines = self._line_filter.filter(lines)
+        if self._collapse_key is not None:
+            self._update_from_collapsed_lines(lines)
+            return
+        skipped = len(lines) - self._max_lines_count
+        if skipped > 0:
+            self._skipped_lines_count += skipped
+            lines = lines[skipped:]
+        for line in lines:
+            self._show_line(line)
+
+    def _update_from_collapsed_lines(self, lines):
+        """_update_from_collapsed_lines(self, lines)
+        Update the sector with the given lines of output, merging the runs of lines with the same collapse key
+        before any board line is set, so a run costs a single update of a board line
+
+        lines - A list of lines of output (strings)
+        """
+        runs = list(self._collapse_runs(lines))
+        skipped = len(runs) - self._max_lines_count
+        if skipped > 0:
+            self._skipped_lines_count += sum(run[2] for run in runs[:skipped])
+            runs = runs[skipped:]
+            # The dropped runs came between the previous line and the first kept run
+            self._last_key = None
+        for line, key, repeat in runs:
+            self._show_line(line, key, repeat)
+
+    def _collapse_runs(self, lines):
+        """_collapse_runs(self, lines) -> iterator
+        Iterate over the runs of consecutive lines with the same collapse key in the given lines,
+        as [last line, key, lines count] lists
+
+        lines - An iterable of lines of output (strings)
+        """
+        key_func = self._collapse_key
+        run = None
+        for line in lines:
+            key = key_func(line)
+            if run is not None and key == run[1]:
+                run[0] = line
+                run[2] += 1
+            else:
+                if run is not None:
+                    yield run
+                run = [line, key, 1]
+        if run is not None:
+            yield run
+
+    def feed(self, data):
+        """feed(self, data)
+        Update the sector with a chunk of output. The chunk may contain any number of lines and a partial
+        last line, which is completed by the next chunks.
+
+        data - The chunk of output (string or bytes)
+        """
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data)
+        lines = (self._partial_line + data).split("\n")
+        self._partial_line = lines.pop()
+        self._update_from_lines(lines)
+
+    def feed_eof(self):
+        """feed_eof(self)
+        Signal the end of the output, the partial last line (if any) is added to the sector.
+        """
+        line = self._partial_line + self._decoder.decode(b"", True)
+        self._partial_line = ""
+        if line:
+            self._update_from_lines([line])
+
+    def drain_file(self, file):
+        """drain_file(self, file) -> bool
+        Update the sector with all of the output that is currently available in the given file without blocking,
+        returning true as long as the end of the file was not reached.
+        The output is read in large chunks and only the last lines that fit in the sector are turned into board lines.
+
+        file - The file object (or file descriptor) to read the output from
+        * NOTE: The file is read directly from its file descriptor, so it should not be read by
+        update_from_file or any other buffered read.
+        """
+        fd = file if isinstance(file, int) else file.fileno()
+        chunks = []
+        eof = False
+        while select.select([fd], [], [], 0)[0]:
+            chunk = os.read(fd, PROCESS_SECTOR_DRAIN_CHUNK_SIZE)
+            if not chunk:
+                eof = True
+                break
+            chunks.append(chunk)
+
+        if chunks:
+            self.feed(b"".join(chunks))
+        if eof:
+            self.feed_eof()
+        return not eof
+
+class FileTailSector(ProcessSector):
+    def __init__(self, sector_id, path, max_lines_count=LOG_BOARD_SECTOR_DEFAULT_LINES_COUNT, title_line=None,
+                 draw_empty=True, line_cls=PlainTextLine, line_handler=None, history=None, line_filter=None, collapse=None,
+                 **line_fields):
+        """FileTailSector(self, sector_id, path, max_lines_count, title_line, draw_empty, line_cls, line_handler, history, line_filter,
+                          collapse, **line_fields)
+        Creates a FileTailSector which is a subclass of ProcessSector
+        This is a special sector class that follows the end of a (possibly very large) file, like 'tail -F'.
+        The last lines of the file are found by scanning it backwards from its end, and then only the bytes that
+        are appended to the file are read. Truncation and rotation (the path being replaced by a new file) of the
+        file are detected, and the new content is followed.
+
+        sector_id - The ID of the sector, used for accessing it from the containing board object
+        path - The path of the file to follow, the file may not exist yet
+        max_lines_count - The maximum lines count to set for this sector (Not including the title line)
+        title_line - A title line to display when drawing the sector, if none is given, no title will be drawn,
+        otherwise a title will be drawn using the given BoardLine and both lines_count and max_lines_count will increase by one.
+        (default: None)
+        draw_empty - A boolean that indicates wether or not the empty lines of the sector should be drawn (default: True)
+        line_cls - The BoardLine class to use for drawing the lines of the file (default: PlainTextLine)
+        line_handler - A callable that receives a line and manipulates it as desired
+        history - Keep the followed lines in a LineHistory, see ProcessSector (default: None - no history is kept)
+        line_filter - A LineFilter that the lines must pass to be shown, see ProcessSector (default: None - all lines are shown)
+        collapse - Merge consecutive duplicate lines, see ProcessSector (default: None - lines are never collapsed)
+        **line_fields - kwargs to format the created Boardlines. The values should be either a callable that returns a string or a string,
+        the callables are called for each line of output. A ComputedText value is computed only when the line is drawn.
+        """
+        super(FileTailSector, self).__init__(sector_id, max_lines_count=max_lines_count, title_line=title_line,
+                                             draw_empty=draw_empty, line_cls=line_cls, line_handler=line_handler,
+                                             history=history, line_filter=line_filter, collapse=collapse, **line_fields)
+        self._path = path
+        self._fd = None
+        self._file_id = None
+        self._offset = 0
+
+    @property
+    def path(self):
+        """The path property of the FileTailSector
+        """
+        return self._path
+
+    @property
+    def offset(self):
+        """The offset property of the FileTailSector
+        The offset in the followed file up to which it was read
+        """
+        return self._offset
+
+    def poll(self):
+        """poll(self) -> bool
+        Read the bytes that were appended to the file since the previous poll, returning true if anything was read.
+        On the first poll (and after the file was truncated or rotated) only the last lines of the file are read.
+        """
+        if self._fd is None:
+            return self._open()
+
+        try:
+            path_stat = os.stat(self._path)
+        except OSError:
+            path_stat = None
+        if path_stat is not None and (path_stat.st_dev, path_stat.st_ino) != self._file_id:
+            # The file was rotated, read what was left in the old file and follow the new one
+            read = self._read_to_end(os.fstat(self._fd).st_size)
+            self.feed_eof()
+            self.close()
+            return self._open() or read
+
+        size = os.fstat(self._fd).st_size
+        if size < self._offset:
+            # The file was truncated, start over from the last lines of the new content
+            self._reset_partial_line()
+            return self._read_tail(size)
+        return self._read_to_end(size)
+
+    def close(self):
+        """close(self)
+        Stop following the file, a later poll opens it again and reads its last lines
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._file_id = None
+        self._reset_partial_line()
+
+    def _open(self):
+        """_open(self) -> bool
+        Open the file and read its last lines, returning true if anything was read
+        """
+        try:
+            self._fd = os.open(self._path, os.O_RDONLY)
+        except OSError:
+            return False
+        file_stat = os.fstat(self._fd)
+        self._file_id = (file_stat.st_dev, file_stat.st_ino)
+        return self._read_tail(file_stat.st_size)
+
+    def _reset_partial_line(self):
+        self._partial_line = ""
+        self._decoder.reset()
+
+    def _read_tail(self, size):
+        """_read_tail(self, size) -> bool
+        Read the last lines that fit in the sector from the file, scanning it backwards in blocks from the given size.
+        When the sector has a line filter, the scan goes on until enough lines pass the filter, but no further
+        than FILE_TAIL_SECTOR_MAX_FILTERED_SCAN_SIZE bytes from the end of the file.
+
+        size - The size of the file
+        """
+        max_lines_count = self._max_lines_count
+        line_filter = self._line_filter
+        blocks = []
+        newlines_count = 0
+        kept_count = 0
+        # The first (possibly partial) line of the scanned blocks, and wether the file's partial last line is not
+        # counted out yet
+        first_line = b""
+        partial_last_line = True
+        position = size
+        while position > 0:
+            if line_filter is None:
+                if newlines_count > max_lines_count:
+                    break
+            elif kept_count >= max_lines_count or size - position >= FILE_TAIL_SECTOR_MAX_FILTERED_SCAN_SIZE:
+                break
+            block_size = min(FILE_TAIL_SECTOR_BLOCK_SIZE, position)
+            position -= block_size
+            os.lseek(self._fd, position, os.SEEK_SET)
+            block = os.read(self._fd, block_size)
+            newlines_count += block.count(b"\n")
+            blocks.append(block)
+
+            if line_filter is not None:
+                lines = (block + first_line).split(b"\n")
+                first_line = lines.pop(0)
+                if partial_last_line and lines:
+                    lines.pop()
+                    partial_last_line = False
+                kept_count += sum(1 for line in lines if line_filter.test(line.decode("utf-8", "replace")))
+
+        data = b"".join(reversed(blocks))
+        if line_filter is None and newlines_count > max_lines_count:
+            # Keep only the last complete lines that fit in the sector (and the partial last line, if any)
+            data = b"\n".join(data.split(b"\n")[-(max_lines_count + 1):])
+        elif position > 0:
+            # Drop the first line, which may have started before the scanned blocks
+            data = data[data.find(b"\n") + 1:]
+        return self._read_data(data, size)
+
+    def _read_to_end(self, size):
+        """_read_to_end(self, size) -> bool
+        Read the file from the current offset to the given size
+
+        size - The size of the file
+        """
+        if size <= self._offset:
+            return False
+        os.lseek(self._fd, self._offset, os.SEEK_SET)
+        while self._offset < size:
+            chunk = os.read(self._fd, min(PROCESS_SECTOR_DRAIN_CHUNK_SIZE, size - self._offset))
+            if not chunk:
+                break
+            self._read_data(chunk, self._offset + len(chunk))
+        return True
+
+    def _read_data(self, data, end_offset):
+        """_read_data(self, data, end_offset) -> bool
+        Feed the given data that was read from the file up to the given offset
+
+        data - The bytes that were read
+        end_offset - The offset in the file of the end of the data
+        """
+        self._offset = end_offset
+        if not data:
+            return False
+        self.feed(data)
+        return True
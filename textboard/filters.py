@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import re
+import sys
+
+# The flags that can be scoped to a part of a pattern with (?imsx:...), which is supported since Python 3.6
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+_SCOPED_FLAGS_MASK = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+_SCOPED_FLAGS_SUPPORTED = sys.version_info >= (3, 6)
+
+# Global inline flags at the start of a pattern, e.g. (?i)
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?[aiLmsux]+\)")
+# References to groups by their numbers, which are shifted when the pattern is combined with others
+_NUMBERED_REF_RE = re.compile(r"\\[1-9]|\\g<[0-9]|\(\?\([0-9]")
+
+def _compile_patterns(patterns, flags):
+    """_compile_patterns(patterns, flags) -> (re pattern, list)
+    Compile the given patterns, returning a single pattern that matches any of them in one pass and the list of
+    the compiled patterns. Each pattern is wrapped with a named group, so the matching pattern is known by the
+    match's lastgroup, and its own flags are scoped to its group. When the patterns can't be combined (e.g. they
+    refer to their groups by numbers) the combined pattern is None, and the patterns are matched one by one.
+
+    patterns - The patterns to combine (strings or compiled patterns)
+    flags - The re flags to compile the patterns with
+    """
+    if not patterns:
+        raise ValueError("At least one pattern is required")
+    regexes = []
+    for pattern in patterns:
+        if hasattr(pattern, "pattern"):
+            regexes.append(re.compile(pattern.pattern, pattern.flags | flags) if flags else pattern)
+        else:
+            regexes.append(re.compile(pattern, flags))
+
+    global_flags = flags & ~_SCOPED_FLAGS_MASK
+    parts = []
+    for index, regex in enumerate(regexes):
+        source = regex.pattern
+        if not isinstance(source, str) or _NUMBERED_REF_RE.search(source):
+            return None, regexes
+        if regex.flags & ~_SCOPED_FLAGS_MASK & ~re.UNICODE != global_flags & ~re.UNICODE:
+            return None, regexes
+        source = _GLOBAL_FLAGS_RE.sub("", source)
+        scoped = "".join(letter for flag, letter in _SCOPED_FLAGS if regex.flags & flag)
+        if scoped:
+            if not _SCOPED_FLAGS_SUPPORTED:
+                return None, regexes
+            # A verbose pattern may end with a comment, that would hide the closing parenthesis
+            source = "(?{scoped}:{source}{end})".format(scoped=scoped, source=source, end="\n" if "x" in scoped else "")
+        parts.append("(?P<_p{index}>{source})".format(index=index, source=source))
+    try:
+        return re.compile("|".join(parts), global_flags), regexes
+    except re.error:
+        return None, regexes
+
+def _pattern_index(match):
+    """_pattern_index(match) -> int
+    Returns the index of the pattern that the given match of a combined pattern matched
+    """
+    return int(match.lastgroup[2:])
+
+class LineFilter(object):
+    def __init__(self, *patterns, **kwargs):
+        """LineFilter(self, *patterns, invert=False, flags=0)
+        Creates a filter of lines of output by regular expressions. The patterns are compiled once into a single
+        pattern, so a line is matched against all of them in one pass.
+
+        *patterns - The patterns to match (strings or compiled patterns), a line is kept if any of them matches
+        invert - Keep the lines that don't match any of the patterns instead (default: False)
+        flags - The re flags to compile the patterns with (default: 0)
+        """
+        self._invert = kwargs.pop("invert", False)
+        flags = kwargs.pop("flags", 0)
+        if kwargs:
+            raise TypeError("Unexpected keyword arguments: {args}".format(args=", ".join(kwargs)))
+        self._patterns = patterns
+        self._regex, self._regexes = _compile_patterns(patterns, flags)
+        self.reset_counters()
+
+    @property
+    def patterns(self):
+        """The patterns property of the LineFilter
+        """
+        return self._patterns
+
+    @property
+    def invert(self):
+        """The invert property of the LineFilter
+        """
+        return self._invert
+
+    def reset_counters(self):
+        """reset_counters(self)
+        Zero the matched and dropped counters
+        """
+        self.matched_count = 0
+        self.dropped_count = 0
+        self.matched_by_pattern = [0] * len(self._patterns)
+
+    def match(self, line):
+        """match(self, line) -> bool
+        Returns wether the given line should be kept, and counts it
+
+        line - The line of text
+        """
+        index = self._match_index(line)
+        if index >= 0:
+            self.matched_count += 1
+            self.matched_by_pattern[index] += 1
+        if (index < 0) != self._invert:
+            self.dropped_count += 1
+            return False
+        return True
+
+    def test(self, line):
+        """test(self, line) -> bool
+        Returns wether the given line should be kept, without counting it
+
+        line - The line of text
+        """
+        return (self._match_index(line) < 0) == self._invert
+
+    def _match_index(self, line):
+        """_match_index(self, line) -> int
+        Returns the index of the pattern that matches the given line, or -1 if none of them does
+        """
+        if self._regex is not None:
+            match = self._regex.search(line)
+            return -1 if match is None else _pattern_index(match)
+        for index, regex in enumerate(self._regexes):
+            if regex.search(line) is not None:
+                return index
+        return -1
+
+    def filter(self, lines):
+        """filter(self, lines) -> list
+        Returns the lines that should be kept out of the given lines, and counts them
+
+        lines - A list of lines of text
+        """
+        if self._regex is not None:
+            search = self._regex.search
+            indexes = [-1 if match is None else _pattern_index(match) for match in map(search, lines)]
+        else:
+            indexes = [self._match_index(line) for line in lines]
+        matched_by_pattern = self.matched_by_pattern
+        matched_count = 0
+        for index in indexes:
+            if index >= 0:
+                matched_count += 1
+                matched_by_pattern[index] += 1
+        self.matched_count += matched_count
+
+        if self._invert:
+            kept = [line for line, index in zip(lines, indexes) if index < 0]
+        else:
+            kept = [line for line, index in zip(lines, indexes) if index >= 0]
+        self.dropped_count += len(lines) - len(kept)
+        return kept
+
+class StreamSearch(object):
+    def __init__(self, history, *patterns, **kwargs):
+        """StreamSearch(self, history, *patterns, flags=0)
+        Creates an incremental search of a LineHistory. Each call to update searches only the lines that
+        were added to the history since the previous call.
+
+        history - The LineHistory to search
+        *patterns - The patterns to search for (strings or compiled patterns), in one pass
+        flags - The re flags to compile the patterns with (default: 0)
+        """
+        flags = kwargs.pop("flags", 0)
+        if kwargs:
+            raise TypeError("Unexpected keyword arguments: {args}".format(args=", ".join(kwargs)))
+        self._history = history
+        self._regex, self._regexes = _compile_patterns(patterns, flags)
+        self._next_line = 0
+        self._matches = []
+
+    @property
+    def matches(self):
+        """The matches property of the StreamSearch
+        All of the matches found so far, as (line number, start, end, pattern index) tuples
+        """
+        return self._matches
+
+    @property
+    def searched_lines_count(self):
+        """The searched lines count property of the StreamSearch
+        """
+        return self._next_line
+
+    def update(self):
+        """update(self) -> list
+        Search the lines that were added to the history since the previous update, returning their matches
+        as (line number, start, end, pattern index) tuples
+        """
+        start, stop = self._next_line, len(self._history)
+        new_matches = []
+        if self._regex is not None:
+            finditer = self._regex.finditer
+            for line_number, line in enumerate(self._history.lines(start, stop), start):
+                for match in finditer(line):
+                    new_matches.append((line_number, match.start(), match.end(), _pattern_index(match)))
+        else:
+            for line_number, line in enumerate(self._history.lines(start, stop), start):
+                line_matches = [(line_number, match.start(), match.end(), index)
+                                for index, regex in enumerate(self._regexes) for match in regex.finditer(line)]
+                line_matches.sort()
+                new_matches.extend(line_matches)
+        self._next_line = stop
+        self._matches.extend(new_matches)
+        return new_matches
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import bisect
+import tempfile
+
+from array import array
+
+LINE_HISTORY_DEFAULT_MEMORY_LIMIT = 4 * 1024 * 1024
+LINE_HISTORY_MIN_CHUNK_SIZE = 4 * 1024
+
+class _HistoryChunk(object):
+    """_HistoryChunk - A run of consecutive lines of a LineHistory, kept in memory or in the spill file"""
+    __slots__ = ("first_line", "offsets", "data", "file_offset")
+
+    def __init__(self, first_line):
+        self.first_line = first_line
+        # The offset of each line in the chunk's data, followed by the end offset of the last line
+        self.offsets = array("L", [0])
+        self.data = bytearray()
+        self.file_offset = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def size(self):
+        return self.offsets[-1]
+
+class LineHistory(object):
+    def __init__(self, memory_limit=LINE_HISTORY_DEFAULT_MEMORY_LIMIT, encoding="utf-8"):
+        """LineHistory(self, memory_limit=LINE_HISTORY_DEFAULT_MEMORY_LIMIT, encoding="utf-8")
+        Creates a compact history of lines of text with random access by line number.
+        The lines are kept encoded in chunks of a bytes arena with an array of their offsets, instead of board lines.
+        When the encoded lines take more than memory_limit bytes, the oldest chunks are spilled to a temporary file.
+
+        memory_limit - The maximum size in bytes of the lines that are kept in memory
+        (default: LINE_HISTORY_DEFAULT_MEMORY_LIMIT)
+        encoding - The encoding of the lines in the arena (default: "utf-8")
+        * NOTE: The offsets of the spilled lines are kept in memory, a few bytes per line.
+        """
+        self._memory_limit = memory_limit
+        self._chunk_size = max(LINE_HISTORY_MIN_CHUNK_SIZE, memory_limit // 4)
+        self._encoding = encoding
+        self._chunks = [_HistoryChunk(0)]
+        self._first_lines = [0]
+        self._lines_count = 0
+        self._memory_size = 0
+        self._memory_chunk_index = 0
+        self._spill_file = None
+        self._spill_size = 0
+
+    def __len__(self):
+        return self._lines_count
+
+    @property
+    def memory_limit(self):
+        """The memory limit property of the LineHistory
+        """
+        return self._memory_limit
+
+    @property
+    def memory_size(self):
+        """The memory size property of the LineHistory
+        The size in bytes of the encoded lines that are kept in memory
+        """
+        return self._memory_size
+
+    @property
+    def spilled_lines_count(self):
+        """The spilled lines count property of the LineHistory
+        The number of the oldest lines that were spilled to the temporary file
+        """
+        return self._chunks[self._memory_chunk_index].first_line
+
+    def append(self, line):
+        """append(self, line)
+        Add a line to the end of the history
+
+        line - The line of text (string or bytes), a trailing newline is removed
+        """
+        if not isinstance(line, bytes):
+            line = line.encode(self._encoding, "replace")
+        if line.endswith(b"\n"):
+            line = line[:-1]
+
+        chunk = self._chunks[-1]
+        chunk.data += line
+        chunk.offsets.append(len(chunk.data))
+        self._lines_count += 1
+        self._memory_size += len(line)
+
+        if len(chunk.data) >= self._chunk_size:
+            chunk = _HistoryChunk(self._lines_count)
+            self._chunks.append(chunk)
+            self._first_lines.append(chunk.first_line)
+        if self._memory_size > self._memory_limit:
+            self._spill()
+
+    def extend(self, lines):
+        """extend(self, lines)
+        Add lines to the end of the history
+
+        lines - An iterable of lines of text
+        """
+        for line in lines:
+            self.append(line)
+
+    def __getitem__(self, index):
+        """__getitem__(self, index) -> str or list
+        Get a line by its number (or a list of lines by a slice of line numbers)
+
+        index - The number of the line, from the oldest line, or a slice
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._lines_count)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return list(self.lines(start, stop))
+        if index < 0:
+            index += self._lines_count
+        if not 0 <= index < self._lines_count:
+            raise IndexError("History line {index} is out of range".format(index=index))
+        return next(self.lines(index, index + 1))
+
+    def lines(self, start=0, stop=None):
+        """lines(self, start=0, stop=None) -> iterator
+        Iterate over the lines in the given range of line numbers. Each chunk is read with a single read.
+
+        start - The number of the first line (default: 0)
+        stop - The number of the line to stop at (default: None - the end of the history)
+        """
+        stop = self._lines_count if stop is None else min(stop, self._lines_count)
+        index = max(0, start)
+        while index < stop:
+            chunk = self._chunks[bisect.bisect_right(self._first_lines, index) - 1]
+            first = index - chunk.first_line
+            last = min(stop - chunk.first_line, len(chunk))
+            offsets = chunk.offsets
+            data = self._read_chunk(chunk, offsets[first], offsets[last])
+            base = offsets[first]
+            for i in range(first, last):
+                yield data[offsets[i] - base:offsets[i + 1] - base].decode(self._encoding, "replace")
+            index = chunk.first_line + last
+
+    def close(self):
+        """close(self)
+        Remove the temporary spill file, the spilled lines are lost
+        """
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def _read_chunk(self, chunk, start, end):
+        """_read_chunk(self, chunk, start, end) -> bytes
+        Read a range of the data of a chunk, from memory or from the spill file
+        """
+        if chunk.data is not None:
+            return bytes(chunk.data[start:end])
+        self._spill_file.seek(chunk.file_offset + start)
+        return self._spill_file.read(end - start)
+
+    def _spill(self):
+        """_spill(self)
+        Write the oldest chunks in memory to the spill file until the memory limit is kept,
+        the chunk that is being filled is never spilled
+        """
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="textboard-history-")
+        while self._memory_size > self._memory_limit and self._memory_chunk_index < len(self._chunks) - 1:
+            chunk = self._chunks[self._memory_chunk_index]
+            self._spill_file.seek(self._spill_size)
+            self._spill_file.write(chunk.data)
+            chunk.file_offset = self._spill_size
+            self._spill_size += chunk.size
+            self._memory_size -= chunk.size
+            chunk.data = None
+            self._memory_chunk_index += 1
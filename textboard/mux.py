@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+import os
+import time
+import selectors
+
+from textboard.board import BOARD_DEFAULT_FPS, PROCESS_SECTOR_DRAIN_CHUNK_SIZE
+
+# The maximum time to wait between checks of the processes that closed their output but did not end yet
+PROCESS_MULTIPLEXER_EXIT_POLL_INTERVAL = 0.05
+
+class ProcessMultiplexer(object):
+    def __init__(self, board=None, fps=BOARD_DEFAULT_FPS):
+        """ProcessMultiplexer(self, board=None, fps=BOARD_DEFAULT_FPS)
+        Creates a multiplexer that follows the output of many processes from a single thread.
+        The pipes of the processes are registered with the platform's best selector (epoll on Linux),
+        and whatever is ready is read and fed to the pipe's ProcessSector.
+
+        board - The board to draw while running (default: None - the board is not drawn)
+        fps - The maximum number of frames to draw per second (default: BOARD_DEFAULT_FPS)
+        """
+        self._board = board
+        self._frame_interval = 1.0 / fps
+        self._selector = selectors.DefaultSelector()
+        self._exit_codes = {}
+        # The processes that closed their output but did not end yet, by their sector
+        self._exiting = {}
+
+    @property
+    def board(self):
+        """The board property of the ProcessMultiplexer"""
+        return self._board
+
+    @property
+    def tracked_count(self):
+        """The tracked count property of the ProcessMultiplexer
+        The number of pipes that did not reach their end yet
+        """
+        return len(self._selector.get_map())
+
+    @property
+    def exit_codes(self):
+        """The exit codes property of the ProcessMultiplexer
+        A dictionary of the exit codes of the tracked processes that ended, by their sector's ID.
+        A process that keeps running after closing its output has its exit code collected by the polls that follow.
+        """
+        return self._exit_codes
+
+    def track(self, sector, source):
+        """track(self, sector, source) -> self
+        Track the output of the given source with the given sector
+
+        sector - The ProcessSector to feed with the output
+        source - A subprocess.Popen that was created with stdout=PIPE, a file object or a file descriptor.
+        The stdout of a Popen is closed when it reaches its end, other sources are left to their owner.
+        """
+        proc = None
+        if hasattr(source, "stdout") and hasattr(source, "wait"):
+            proc, source = source, source.stdout
+        self._selector.register(source, selectors.EVENT_READ, (sector, proc))
+        return self
+
+    def poll(self, timeout=None):
+        """poll(self, timeout=None) -> int
+        Wait for output from the tracked pipes and feed it to their sectors, returning the number
+        of pipes that were read. A pipe that reached its end is unregistered, and the exit code of
+        its process (if any) is collected once the process ends, without waiting for it.
+
+        timeout - The maximum time to wait, in seconds (default: None - wait until any output is ready).
+        While processes that closed their output are still running, the wait is limited to
+        PROCESS_MULTIPLEXER_EXIT_POLL_INTERVAL.
+        """
+        if self._exiting and (timeout is None or timeout > PROCESS_MULTIPLEXER_EXIT_POLL_INTERVAL):
+            timeout = PROCESS_MULTIPLEXER_EXIT_POLL_INTERVAL
+        if not self._selector.get_map():
+            # Only processes that closed their output are left, some selectors can't wait with no pipes
+            time.sleep(timeout or 0)
+            ready = []
+        else:
+            ready = self._selector.select(timeout)
+        for key, events in ready:
+            sector, proc = key.data
+            chunk = os.read(key.fd, PROCESS_SECTOR_DRAIN_CHUNK_SIZE)
+            if chunk:
+                sector.feed(chunk)
+                continue
+
+            self._selector.unregister(key.fileobj)
+            sector.feed_eof()
+            if proc is not None:
+                key.fileobj.close()
+                self._exiting[sector] = proc
+
+        if self._exiting:
+            self._collect_exit_codes()
+
+        return len(ready)
+
+    def _collect_exit_codes(self):
+        """_collect_exit_codes(self)
+        Collect the exit codes of the processes that closed their output and ended since the previous poll
+        """
+        for sector, proc in list(self._exiting.items()):
+            exit_code = proc.poll()
+            if exit_code is not None:
+                self._exit_codes[sector.id] = exit_code
+                del self._exiting[sector]
+
+    def run(self, clear_screen=False):
+        """run(self, clear_screen=False)
+        Follow the tracked pipes until all of them reach their end and their processes (if any) end,
+        drawing the board (if any) no more than fps times per second. The board is drawn one last time
+        before returning.
+
+        clear_screen - indicates wether the screen should be cleared before the first frame (default: False)
+        """
+        next_frame = time.time()
+        while self.tracked_count or self._exiting:
+            if self._board is None:
+                self.poll()
+                continue
+
+            self.poll(max(0, next_frame - time.time()))
+            now = time.time()
+            if now >= next_frame:
+                self._board.draw(clear_screen)
+                clear_screen = False
+                next_frame = now + self._frame_interval
+
+        if self._board is not None:
+            self._board.draw(clear_screen)
+
+    def close(self):
+        """close(self)
+        Stop tracking all of the pipes, closing the stdout of the tracked Popens
+        """
+        for key in list(self._selector.get_map().values()):
+            if key.data[1] is not None:
+                key.fileobj.close()
+        self._selector.close()
+        self._exiting.clear()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+import time
+import struct
+
+from multiprocessing import shared_memory
+
+SHARED_BOARD_DEFAULT_SLOT_SIZE = 128
+SHARED_BOARD_READ_ATTEMPTS = 1000
+
+# The header of the shared memory block: magic, slots count and slot size
+_HEADER = struct.Struct("<4sII")
+_HEADER_SIZE = 16
+_MAGIC = b"TBSM"
+
+_GENERATION = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+
+class SharedBoardModel(object):
+    def __init__(self, slots_count, slot_size=SHARED_BOARD_DEFAULT_SLOT_SIZE, name=None, _shm=None):
+        """SharedBoardModel(self, slots_count, slot_size=SHARED_BOARD_DEFAULT_SLOT_SIZE, name=None)
+        Creates a block of shared memory with a fixed number of text slots. Worker processes write the text
+        of their slots directly to the shared memory, and the rendering process copies only the slots that
+        were changed since its previous sync to the fields bound to them.
+
+        Each slot has a generation counter that is odd while the slot is written, so a reader never sees a half
+        written text. A slot should be written by a single process at a time.
+
+        slots_count - The number of slots in the block
+        slot_size - The maximum size in bytes of the utf-8 text of a slot, longer texts are truncated
+        (default: SHARED_BOARD_DEFAULT_SLOT_SIZE)
+        name - The name of the shared memory block (default: None - a unique name is generated)
+        """
+        self._slots_count = slots_count
+        self._slot_size = slot_size
+        self._gens_offset = _HEADER_SIZE
+        self._lens_offset = self._gens_offset + _GENERATION.size * slots_count
+        self._data_offset = self._lens_offset + _LENGTH.size * slots_count
+        if _shm is None:
+            _shm = shared_memory.SharedMemory(name=name, create=True, size=self._data_offset + slot_size * slots_count)
+            _HEADER.pack_into(_shm.buf, 0, _MAGIC, slots_count, slot_size)
+            self._owner = True
+        else:
+            self._owner = False
+        self._shm = _shm
+        self._name = _shm.name
+        self._buf = _shm.buf
+        self._gens = self._buf[self._gens_offset:self._lens_offset].cast("Q")
+        self._seen_gens = bytes(self._buf[self._gens_offset:self._lens_offset])
+        self._bindings = {}
+
+    @classmethod
+    def attach(cls, name):
+        """attach(cls, name) -> SharedBoardModel
+        Attach to the shared memory block of an existing SharedBoardModel, usually from a worker process
+
+        name - The name of the shared memory block
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        magic, slots_count, slot_size = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC:
+            shm.close()
+            raise ValueError("Shared memory block '{name}' is not a SharedBoardModel".format(name=name))
+        return cls(slots_count, slot_size, _shm=shm)
+
+    def __reduce__(self):
+        # Models that are passed to other processes attach to the same block instead of being copied
+        return (self.attach, (self.name,))
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._owner:
+            self.unlink()
+        self.close()
+
+    @property
+    def name(self):
+        """The name property of the SharedBoardModel
+        The name of the shared memory block, used to attach to it
+        """
+        return self._name
+
+    @property
+    def slots_count(self):
+        """The slots count property of the SharedBoardModel
+        """
+        return self._slots_count
+
+    @property
+    def slot_size(self):
+        """The slot size property of the SharedBoardModel
+        """
+        return self._slot_size
+
+    def write(self, slot, text):
+        """write(self, slot, text)
+        Write the text of the given slot
+
+        slot - The index of the slot to write
+        text - The text to write (string or bytes), truncated to the slot size
+        """
+        if not isinstance(text, bytes):
+            text = text.encode("utf-8")
+        text = text[:self._slot_size]
+        gens = self._gens
+        # The generation is odd if a previous writer of the slot died in the middle of its write
+        generation = gens[slot] | 1
+        gens[slot] = generation
+        data_offset = self._data_offset + slot * self._slot_size
+        self._buf[data_offset:data_offset + len(text)] = text
+        _LENGTH.pack_into(self._buf, self._lens_offset + slot * _LENGTH.size, len(text))
+        gens[slot] = generation + 1
+
+    def read(self, slot):
+        """read(self, slot) -> str
+        Read the text of the given slot, waiting for a concurrent write of the slot to end.
+        Returns None if the slot is still written after SHARED_BOARD_READ_ATTEMPTS attempts
+        (e.g. its writer died in the middle of a write).
+
+        slot - The index of the slot to read
+        """
+        gens, buf = self._gens, self._buf
+        data_offset = self._data_offset + slot * self._slot_size
+        length_offset = self._lens_offset + slot * _LENGTH.size
+        for attempt in range(SHARED_BOARD_READ_ATTEMPTS):
+            generation = gens[slot]
+            if not generation & 1:
+                length = _LENGTH.unpack_from(buf, length_offset)[0]
+                data = bytes(buf[data_offset:data_offset + min(length, self._slot_size)])
+                if gens[slot] == generation:
+                    return data.decode("utf-8", "ignore")
+            # Let the writer finish its write
+            time.sleep(0)
+        return None
+
+    def bind(self, slot, line, field_id="text"):
+        """bind(self, slot, line, field_id="text") -> self
+        Bind a slot to a field of a board line, the text of the slot is set to the field on each sync
+
+        slot - The index of the slot
+        line - The BoardLine to update
+        field_id - The ID of the field to update (default: "text")
+        """
+        if not 0 <= slot < self._slots_count:
+            raise IndexError("Slot {slot} is out of range".format(slot=slot))
+        self._bindings[slot] = line.get(field_id)
+        return self
+
+    def unbind(self, slot):
+        """unbind(self, slot)
+        Stop updating the field bound to the given slot
+
+        slot - The index of the slot
+        """
+        self._bindings.pop(slot, None)
+
+    def changed_slots(self):
+        """changed_slots(self) -> list
+        Returns the indexes of the slots that were written since the previous call
+        """
+        gens_bytes = bytes(self._buf[self._gens_offset:self._lens_offset])
+        seen_gens = self._seen_gens
+        if gens_bytes == seen_gens:
+            return []
+        self._seen_gens = gens_bytes
+        size = _GENERATION.size
+        return [slot for slot in range(self._slots_count)
+                if gens_bytes[slot * size:(slot + 1) * size] != seen_gens[slot * size:(slot + 1) * size]]
+
+    def sync(self):
+        """sync(self) -> int
+        Set the text of the slots that were written since the previous sync to their bound fields,
+        returns the number of changed slots. Should be called by the rendering process before drawing.
+        A slot that is in the middle of a write for too long is skipped until its next write.
+        """
+        changed = self.changed_slots()
+        for slot in changed:
+            field = self._bindings.get(slot)
+            if field is not None:
+                text = self.read(slot)
+                # A skipped slot is read again by the sync that follows the end of its write, since the end
+                # of the write changes its generation
+                if text is not None:
+                    field.text = text
+        return len(changed)
+
+    def close(self):
+        """close(self)
+        Detach from the shared memory block
+        """
+        if getattr(self, "_shm", None) is None:
+            return
+        self._gens.release()
+        self._gens = self._buf = None
+        self._shm.close()
+        self._shm = None
+
+    def unlink(self):
+        """unlink(self)
+        Destroy the shared memory block, should be called once by the process that created it before closing it.
+        The processes that are attached to the block may keep using it until they close it.
+        """
+        self._shm.unlink()
@@ -0,0 +1,401 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import io
+import os
+import re
+import sys
+
+from abc import ABCMeta, abstractmethod
+
+class Sink(object):
+    """Sink
+    The base class of the output targets of a board
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def write(self, data):
+        """write(self, data)
+        Write the given string to the sink
+
+        data - The string to write
+        """
+        pass
+
+    def flush(self):
+        """flush(self)
+        Flush the written data to the sink's target
+        """
+        pass
+
+    @property
+    def lines(self):
+        """The lines property of the Sink
+        The height of the screen the sink writes to, or None if it is unknown or unlimited
+        """
+        return None
+
+class StreamSink(Sink):
+    """StreamSink
+    A sink that writes to a text or binary stream
+    """
+    def __init__(self, stream, encoding="utf-8"):
+        """StreamSink(self, stream, encoding="utf-8")
+        Create a sink that writes to the given stream
+
+        stream - A text or binary file like object to write to
+        encoding - The encoding of the data written to binary streams (default: "utf-8")
+        """
+        self._stream = stream
+        self._encoding = encoding
+        self._binary = _is_binary_stream(stream)
+
+    @property
+    def stream(self):
+        """The stream property of the StreamSink
+        """
+        return self._stream
+
+    @property
+    def lines(self):
+        """The lines property of the StreamSink
+        The height of the terminal if the stream is a terminal, otherwise None
+        """
+        stream = self.stream
+        try:
+            if not stream.isatty():
+                return None
+            return os.get_terminal_size(stream.fileno()).lines or None
+        except (AttributeError, ValueError, OSError, io.UnsupportedOperation):
+            return None
+
+    def write(self, data):
+        """write(self, data)
+        Write the given string to the stream, the string is encoded if the stream is binary
+
+        data - The string to write
+        """
+        if self._binary:
+            data = data.encode(self._encoding)
+        self._stream.write(data)
+
+    def flush(self):
+        """flush(self)
+        Flush the stream
+        """
+        self._stream.flush()
+
+class StdoutSink(StreamSink):
+    """StdoutSink
+    A sink that writes to the current standard output, the default sink of the boards
+    """
+    def __init__(self):
+        """StdoutSink(self)
+        Create a sink that writes to sys.stdout, even if it is replaced after the sink was created
+        """
+        super(StdoutSink, self).__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        """The stream property of the StdoutSink
+        """
+        return sys.stdout
+
+    def write(self, data):
+        """write(self, data)
+        Write the given string to the standard output
+
+        data - The string to write
+        """
+        sys.stdout.write(data)
+
+    def flush(self):
+        """flush(self)
+        Flush the standard output
+        """
+        sys.stdout.flush()
+
+class BytearraySink(Sink):
+    """BytearraySink
+    A sink that encodes the written data into a pre-sized bytearray, the bytearray is grown only
+    when the written data doesn't fit in it
+    """
+    def __init__(self, size=64 * 1024, encoding="utf-8"):
+        """BytearraySink(self, size=64 * 1024, encoding="utf-8")
+        Create a sink that writes to a bytearray
+
+        size - The initial size of the bytearray in bytes (default: 64KiB)
+        encoding - The encoding of the written data (default: "utf-8")
+        """
+        self._buffer = bytearray(size)
+        self._length = 0
+        self._encoding = encoding
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def buffer(self):
+        """The buffer property of the BytearraySink
+        The bytearray that is written to, only its first len(sink) bytes are valid
+        """
+        return self._buffer
+
+    def getvalue(self):
+        """getvalue(self) -> bytes
+        Returns the bytes written to the sink
+        """
+        return bytes(self._buffer[:self._length])
+
+    def clear(self):
+        """clear(self)
+        Discard the written data, the bytearray is kept for the next writes
+        """
+        self._length = 0
+
+    def write(self, data):
+        """write(self, data)
+        Encode the given string into the bytearray
+
+        data - The string to write
+        """
+        data = data.encode(self._encoding)
+        end = self._length + len(data)
+        if end > len(self._buffer):
+            self._buffer.extend(bytearray(max(end - len(self._buffer), len(self._buffer))))
+        self._buffer[self._length:end] = data
+        self._length = end
+
+class NullSink(Sink):
+    """NullSink
+    A sink that discards the written data, only counting it. Useful for measuring the rendering
+    of a board without the terminal's I/O
+    """
+    def __init__(self):
+        """NullSink(self)
+        Create a sink that discards the written data
+        """
+        self.chars_written = 0
+        self.writes_count = 0
+
+    def write(self, data):
+        """write(self, data)
+        Count the given string and discard it
+
+        data - The string to write
+        """
+        self.chars_written += len(data)
+        self.writes_count += 1
+
+# Matches a control sequence (with its parameters and final byte), a two characters escape sequence,
+# or a run of text without escape or control characters
+_SCREEN_TOKEN_RE = re.compile(r"\x1b\[([0-9;?]*)([@-~])|\x1b([@-~])|([^\x1b\r\n\b]+)|([\r\n\b])")
+
+class VirtualScreen(Sink):
+    """VirtualScreen
+    A headless terminal screen, the written data is applied to an in-memory grid of characters.
+    Supports the cursor movement, erase and graphic rendition escape sequences used by the boards.
+    """
+    def __init__(self, columns=80, lines=24):
+        """VirtualScreen(self, columns=80, lines=24)
+        Create an empty virtual screen
+
+        columns - The width of the screen (default: 80)
+        lines - The height of the screen (default: 24)
+        """
+        self._columns = columns
+        self._lines = lines
+        self.reset()
+
+    @property
+    def columns(self):
+        """The columns property of the VirtualScreen
+        """
+        return self._columns
+
+    @property
+    def lines(self):
+        """The lines property of the VirtualScreen
+        """
+        return self._lines
+
+    @property
+    def cursor(self):
+        """The cursor property of the VirtualScreen
+        The zero based (row, column) position of the cursor
+        """
+        return (self._row, self._col)
+
+    @property
+    def display(self):
+        """The display property of the VirtualScreen
+        A list of the screen rows, without their trailing spaces
+        """
+        return ["".join(row).rstrip() for row in self._chars]
+
+    def style_at(self, row, column):
+        """style_at(self, row, column) -> tuple
+        Returns the sorted SGR codes that the character at the given position was written with
+
+        row - The zero based row of the character
+        column - The zero based column of the character
+        """
+        return self._styles[row][column]
+
+    def reset(self):
+        """reset(self)
+        Clear the screen, its graphic state and move the cursor to the top left corner
+        """
+        self._chars = [self._blank_row() for _ in range(self._lines)]
+        self._styles = [[()] * self._columns for _ in range(self._lines)]
+        self._row = self._col = 0
+        self._saved_cursor = (0, 0)
+        self._sgr = {}
+        self._sgr_key = ()
+
+    def __str__(self):
+        return "\n".join(self.display)
+
+    def write(self, data):
+        """write(self, data)
+        Apply the given text and escape sequences to the screen
+
+        data - The string to write
+        """
+        for match in _SCREEN_TOKEN_RE.finditer(data):
+            params, final, esc, text, control = match.groups()
+            if text is not None:
+                self._put_text(text)
+            elif control is not None:
+                if control == "\n":
+                    self._line_feed()
+                elif control == "\r":
+                    self._col = 0
+                else:
+                    self._col = max(0, self._col - 1)
+            elif final is not None:
+                self._exec_csi(params, final)
+            elif esc == "7":
+                self._saved_cursor = (self._row, self._col)
+            elif esc == "8":
+                self._row, self._col = self._saved_cursor
+
+    def _blank_row(self):
+        return [" "] * self._columns
+
+    def _put_text(self, text):
+        while text:
+            if self._col >= self._columns:
+                self._line_feed()
+            part = text[:self._columns - self._col]
+            end = self._col + len(part)
+            self._chars[self._row][self._col:end] = part
+            self._styles[self._row][self._col:end] = [self._sgr_key] * len(part)
+            self._col = end
+            text = text[len(part):]
+
+    def _line_feed(self):
+        self._col = 0
+        if self._row + 1 < self._lines:
+            self._row += 1
+        else:
+            del self._chars[0]
+            del self._styles[0]
+            self._chars.append(self._blank_row())
+            self._styles.append([()] * self._columns)
+
+    def _erase(self, row, start, end):
+        self._chars[row][start:end] = [" "] * (end - start)
+        self._styles[row][start:end] = [()] * (end - start)
+
+    def _move(self, row, col):
+        self._row = max(0, min(row, self._lines - 1))
+        self._col = max(0, min(col, self._columns - 1))
+
+    def _exec_csi(self, params, final):
+        args = [int(arg) if arg.isdigit() else 0 for arg in params.split(";")] if params else []
+        count = max(1, args[0]) if args else 1
+
+        if final in "Hf":
+            row = args[0] if args else 1
+            col = args[1] if len(args) > 1 else 1
+            self._move(max(1, row) - 1, max(1, col) - 1)
+        elif final == "A":
+            self._move(self._row - count, self._col)
+        elif final == "B":
+            self._move(self._row + count, self._col)
+        elif final == "C":
+            self._move(self._row, self._col + count)
+        elif final == "D":
+            self._move(self._row, self._col - count)
+        elif final == "E":
+            self._move(self._row + count, 0)
+        elif final == "F":
+            self._move(self._row - count, 0)
+        elif final == "G":
+            self._move(self._row, count - 1)
+        elif final == "J":
+            mode = args[0] if args else 0
+            if mode == 0:
+                self._erase(self._row, self._col, self._columns)
+                rows = range(self._row + 1, self._lines)
+            elif mode == 1:
+                self._erase(self._row, 0, self._col + 1)
+                rows = range(0, self._row)
+            else:
+                rows = range(self._lines)
+            for row in rows:
+                self._erase(row, 0, self._columns)
+        elif final == "K":
+            mode = args[0] if args else 0
+            if mode == 0:
+                self._erase(self._row, self._col, self._columns)
+            elif mode == 1:
+                self._erase(self._row, 0, self._col + 1)
+            else:
+                self._erase(self._row, 0, self._columns)
+        elif final == "s":
+            self._saved_cursor = (self._row, self._col)
+        elif final == "u":
+            self._row, self._col = self._saved_cursor
+        elif final == "m":
+            self._apply_sgr(args or [0])
+
+    def _apply_sgr(self, codes):
+        sgr = self._sgr
+        for code in codes:
+            if code == 0:
+                sgr.clear()
+            elif code == 22:
+                sgr.pop(1, None)
+                sgr.pop(2, None)
+            elif code == 25:
+                sgr.pop(5, None)
+                sgr.pop(6, None)
+            elif code in (23, 24, 29):
+                sgr.pop(code - 20, None)
+            elif code == 39:
+                sgr.pop("fg", None)
+            elif code == 49:
+                sgr.pop("bg", None)
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                sgr["fg"] = code
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                sgr["bg"] = code
+            else:
+                sgr[code] = code
+        self._sgr_key = tuple(sorted(sgr.values()))
+
+def _is_binary_stream(stream):
+    """_is_binary_stream(stream) -> bool
+    Returns wether the given stream should be written bytes instead of strings
+
+    stream - The stream to check
+    """
+    if isinstance(stream, io.TextIOBase):
+        return False
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(stream, "mode", "")